@@ -1,8 +1,23 @@
+import io
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import subprocess
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Tuple
 
-from .common import die, ensure_git_repo, git, now_utc, read_json, relative_to_repo, slugify, worktree_is_clean, write_json
+from .common import (
+    die,
+    ensure_git_repo,
+    git,
+    git_bytes,
+    now_utc,
+    read_json,
+    relative_to_repo,
+    run_cmd,
+    slugify,
+    worktree_is_clean,
+    write_json,
+)
 from .config import load_config, write_default_config
 from .execution import load_agents_skills, run_codex_world, run_render_world, run_world, tail_file
 from .render_helper import DEFAULT_RENDER_COMMAND
@@ -13,10 +28,10 @@ from .state import (
     get_latest_branchpoint,
     list_branchpoints,
     load_branchpoint,
-    load_codex_run,
-    load_render,
-    load_run,
-    load_world,
+    load_codex_runs,
+    load_renders,
+    load_runs,
+    load_worlds,
     metadata_root,
     render_file,
     resolve_branchpoint_id,
@@ -26,57 +41,78 @@ from .state import (
     save_render,
     save_run,
     save_world,
+    save_worlds,
     set_latest_branchpoint,
 )
 from .strategy import choose_strategies, make_branchpoint_id
 from .worlds import add_worktree, ensure_base_branch, ensure_worlds_dir, matches_world_filter, resolve_start_ref, write_world_notes
 
 
-def _collect_commit_candidate_paths(worktree: str) -> List[str]:
-    status = git(["status", "--porcelain"], cwd=worktree, check=False)
-    lines = (status.stdout or "").splitlines()
-    paths: List[str] = []
-    for line in lines:
-        text = line.rstrip()
-        if len(text) < 4:
-            continue
-        path_part = text[3:]
-        if " -> " in path_part:
-            path_part = path_part.split(" -> ", 1)[1]
-        path = path_part.strip()
-        if not path:
+# git add failures exit with _COMMIT_ADD_FAILED so they aren't mistaken for "nothing to commit".
+_COMMIT_ADD_FAILED = 90
+_COMMIT_SCRIPT = (
+    'msg="$1"; shift; '
+    f'git add -A -- "$@" || exit {_COMMIT_ADD_FAILED}; '
+    'git -c user.name="Parallel Worlds" -c user.email=parallel-worlds@local commit -q -m "$msg" && '
+    "git rev-parse HEAD"
+)
+
+
+_BOOTSTRAP_SCRIPT = (
+    'git init -q -b "$1" 2>/dev/null || { git init -q && git checkout -q -b "$1"; } || exit 1; '
+    "git add README.md && "
+    'git -c user.name="Parallel Worlds" -c user.email=parallel-worlds@local commit -q -m "Initial commit"'
+)
+
+
+# Number of space-separated fields before the path in `git status --porcelain=v2` records.
+_STATUS_V2_PATH_FIELD = {b"1": 8, b"2": 9, b"u": 10, b"?": 1}
+_COMMIT_SKIP_PATHS = {b"report.md", b"play.md"}
+
+
+def _collect_commit_candidate_paths(worktree: str, include_untracked: bool = True) -> List[str]:
+    args = ["--no-optional-locks", "status", "--porcelain=v2", "-z"]
+    if not include_untracked:
+        # Skips the untracked walk, which dominates status time in trees with large ignored dirs.
+        args.append("--untracked-files=no")
+    status = git_bytes(args, cwd=worktree, check=False)
+    records = (status.stdout or b"").split(b"\0")
+    paths: List[bytes] = []
+    i = 0
+    while i < len(records):
+        record = records[i]
+        i += 1
+        kind = record[:1]
+        fields = _STATUS_V2_PATH_FIELD.get(kind)
+        if fields is None:
             continue
-        if path.startswith(".parallel_worlds/"):
+        if kind == b"2":
+            # Rename/copy records are followed by a separate origin-path record.
+            i += 1
+        parts = record.split(b" ", fields)
+        if len(parts) <= fields:
             continue
-        if path in {"report.md", "play.md"}:
+        path = parts[fields]
+        if path.startswith(b".parallel_worlds/") or path in _COMMIT_SKIP_PATHS:
             continue
         paths.append(path)
 
-    return sorted(set(paths))
+    # git already emits each group path-sorted, so keep its order and only dedupe.
+    return [os.fsdecode(path) for path in dict.fromkeys(paths)]
 
 
 def _commit_paths(worktree: str, paths: List[str], message: str) -> Optional[str]:
     if not paths:
         return None
 
-    git(["add", "-A", "--"] + paths, cwd=worktree, check=True)
-    commit = git(
-        [
-            "-c",
-            "user.name=Parallel Worlds",
-            "-c",
-            "user.email=parallel-worlds@local",
-            "commit",
-            "-m",
-            message,
-        ],
-        cwd=worktree,
-        check=False,
-    )
-    if commit.returncode != 0:
+    # One process for add + commit + rev-parse; paths travel as argv so no quoting is needed.
+    result = run_cmd(["sh", "-c", _COMMIT_SCRIPT, "pw-commit", message] + paths, cwd=worktree, check=False)
+    if result.returncode == _COMMIT_ADD_FAILED:
+        die(f"git add failed in {worktree}: {(result.stderr or '').strip()}")
+    if result.returncode != 0:
         return None
-    head = git(["rev-parse", "HEAD"], cwd=worktree, check=False)
-    return (head.stdout or "").strip() or None
+    lines = (result.stdout or "").strip().splitlines()
+    return lines[-1].strip() if lines else None
 
 
 def _split_commit_chunks(paths: List[str], target_count: int) -> List[List[str]]:
@@ -112,12 +148,13 @@ def _autocommit_world_changes_series(
     branchpoint_id: str,
     prefix: str,
     target_count: int,
+    include_untracked: bool = True,
 ) -> List[str]:
     worktree = world.get("worktree", "")
     if not worktree:
         return []
 
-    unique_paths = _collect_commit_candidate_paths(worktree)
+    unique_paths = _collect_commit_candidate_paths(worktree, include_untracked)
     if not unique_paths:
         return []
 
@@ -182,46 +219,46 @@ def create_project(
         die(f"project path exists and is not a directory: {path}")
 
     os.makedirs(path, exist_ok=True)
-    entries = [name for name in os.listdir(path) if name not in {".DS_Store"}]
-    if entries:
-        die(f"project directory must be empty: {path}")
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.name != ".DS_Store":
+                die(f"project directory must be empty: {path}")
 
     base = (base_branch or "main").strip() or "main"
-    init = git(["init", "-b", base], cwd=path, check=False)
-    if init.returncode != 0:
-        git(["init"], cwd=path, check=True)
-        git(["checkout", "-b", base], cwd=path, check=True)
-
     title = (project_name or os.path.basename(path)).strip() or "Parallel Worlds Project"
     readme_path = os.path.join(path, "README.md")
     with open(readme_path, "w", encoding="utf-8") as f:
         f.write(f"# {title}\n\nBootstrapped with Parallel Worlds.\n")
 
-    git(["add", "README.md"], cwd=path, check=True)
-    git(
-        [
-            "-c",
-            "user.name=Parallel Worlds",
-            "-c",
-            "user.email=parallel-worlds@local",
-            "commit",
-            "-m",
-            "Initial commit",
-        ],
+    # Run the git bootstrap in one process and write the config while it runs.
+    bootstrap = subprocess.Popen(
+        ["sh", "-c", _BOOTSTRAP_SCRIPT, "pw-bootstrap", base],
         cwd=path,
-        check=True,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
     )
 
-    cfg_name = os.path.basename((config_name or "parallel_worlds.json").strip() or "parallel_worlds.json")
-    cfg_path = os.path.join(path, cfg_name)
-    if not os.path.exists(cfg_path):
-        write_default_config(cfg_path, force=False)
-
-    cfg_payload = read_json(cfg_path)
-    if cfg_payload.get("base_branch") != base:
-        cfg_payload["base_branch"] = base
-        write_json(cfg_path, cfg_payload)
-    _ensure_config_commands(cfg_path)
+    try:
+        cfg_name = os.path.basename((config_name or "parallel_worlds.json").strip() or "parallel_worlds.json")
+        cfg_path = os.path.join(path, cfg_name)
+        if not os.path.exists(cfg_path):
+            write_default_config(cfg_path, force=False)
+
+        cfg_payload = read_json(cfg_path)
+        if cfg_payload.get("base_branch") != base:
+            cfg_payload["base_branch"] = base
+            write_json(cfg_path, cfg_payload)
+        _ensure_config_commands(cfg_path)
+    except BaseException:
+        # die() raises SystemExit; don't leave the bootstrap running or unreaped.
+        bootstrap.kill()
+        bootstrap.communicate()
+        raise
+
+    _, bootstrap_err = bootstrap.communicate()
+    if bootstrap.returncode != 0:
+        die(f"failed to initialize git repository: {(bootstrap_err or '').strip()}")
 
     ensure_metadata_dirs(path)
 
@@ -262,17 +299,27 @@ def resolve_worlds_for_branchpoint(repo: str, branchpoint: Dict[str, Any], world
     if not world_ids:
         die(f"branchpoint has no worlds: {branchpoint['id']}")
 
-    selected_worlds: List[Dict[str, Any]] = []
-    for wid in world_ids:
-        world = load_world(repo, wid)
-        if matches_world_filter(world, world_filters):
-            selected_worlds.append(world)
+    selected_worlds = [world for world in load_worlds(repo, world_ids) if matches_world_filter(world, world_filters)]
 
     if not selected_worlds:
         die("no worlds matched provided --world filters")
     return selected_worlds
 
 
+_WORLD_TEMPLATE: Dict[str, Any] = {
+    "status": "ready",
+    "last_run_file": None,
+    "last_exit_code": None,
+    "last_duration_sec": None,
+    "last_codex_file": None,
+    "last_codex_exit_code": None,
+    "last_codex_duration_sec": None,
+    "last_render_file": None,
+    "last_render_exit_code": None,
+    "last_render_duration_sec": None,
+}
+
+
 def kickoff_worlds(
     config_path: str,
     intent: str,
@@ -309,42 +356,39 @@ def kickoff_worlds(
         "selected_world_id": None,
     }
 
+    worlds: List[Dict[str, Any]] = []
     for index, strategy in enumerate(strategies, start=1):
-        name = strategy["name"]
-        notes = strategy.get("notes", "")
-        strategy_slug = slugify(name)
-
-        world_id = f"{branchpoint_id}-{index:02d}-{strategy_slug}"
-        branch = f"{cfg['branch_prefix']}/{branchpoint_id}/{index:02d}-{strategy_slug}"
-        worktree = os.path.join(worlds_root, branchpoint_id, f"{index:02d}-{strategy_slug}")
-
-        add_worktree(branch=branch, start_ref=start_ref, worktree_path=worktree, repo=repo)
-
-        world: Dict[str, Any] = {
-            "id": world_id,
-            "branchpoint_id": branchpoint_id,
-            "index": index,
-            "name": name,
-            "notes": notes,
-            "slug": strategy_slug,
-            "branch": branch,
-            "worktree": worktree,
-            "created_at": created_at,
-            "status": "ready",
-            "last_run_file": None,
-            "last_exit_code": None,
-            "last_duration_sec": None,
-            "last_codex_file": None,
-            "last_codex_exit_code": None,
-            "last_codex_duration_sec": None,
-            "last_render_file": None,
-            "last_render_exit_code": None,
-            "last_render_duration_sec": None,
-        }
-
-        write_world_notes(os.path.join(worktree, ".parallel_worlds"), world, branchpoint)
-        save_world(repo, world)
-        branchpoint["world_ids"].append(world_id)
+        strategy_slug = slugify(strategy["name"])
+        suffix = f"{index:02d}-{strategy_slug}"
+        worlds.append(
+            {
+                "id": f"{branchpoint_id}-{suffix}",
+                "branchpoint_id": branchpoint_id,
+                "index": index,
+                "name": strategy["name"],
+                "notes": strategy.get("notes", ""),
+                "slug": strategy_slug,
+                "branch": f"{cfg['branch_prefix']}/{branchpoint_id}/{suffix}",
+                "worktree": os.path.join(worlds_root, branchpoint_id, suffix),
+                "created_at": created_at,
+                **_WORLD_TEMPLATE,
+            }
+        )
+
+    # Worktree creation is dominated by git process time; each world has its own path and branch.
+    def _add(world: Dict[str, Any]) -> None:
+        add_worktree(branch=world["branch"], start_ref=start_ref, worktree_path=world["worktree"], repo=repo)
+        write_world_notes(os.path.join(world["worktree"], ".parallel_worlds"), world, branchpoint)
+
+    if len(worlds) <= 1:
+        for world in worlds:
+            _add(world)
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(worlds))) as executor:
+            list(executor.map(_add, worlds))
+
+    save_worlds(repo, worlds)
+    branchpoint["world_ids"] = [world["id"] for world in worlds]
 
     save_branchpoint(repo, branchpoint)
     set_latest_branchpoint(repo, branchpoint_id)
@@ -353,12 +397,11 @@ def kickoff_worlds(
     print(f"intent: {intent}")
     print(f"source ref: {start_ref}")
     print(f"worlds: {len(branchpoint['world_ids'])}")
-    for wid in branchpoint["world_ids"]:
-        world = load_world(repo, wid)
-        print(f"- {world['id']} -> branch={world['branch']} worktree={world['worktree']}")
+    print("\n".join(f"- {world['id']} -> branch={world['branch']} worktree={world['worktree']}" for world in worlds))
 
 
 def _failed_run_payload(world: Dict[str, Any], branchpoint: Dict[str, Any], message: str) -> Dict[str, Any]:
+    ts = now_utc()
     return {
         "branchpoint_id": branchpoint["id"],
         "world_id": world["id"],
@@ -366,7 +409,7 @@ def _failed_run_payload(world: Dict[str, Any], branchpoint: Dict[str, Any], mess
         "branch": world["branch"],
         "worktree": world["worktree"],
         "runner": "",
-        "started_at": now_utc(),
+        "started_at": ts,
         "exit_code": None,
         "duration_sec": None,
         "trace_log": None,
@@ -374,11 +417,12 @@ def _failed_run_payload(world: Dict[str, Any], branchpoint: Dict[str, Any], mess
         "diff_patch": None,
         "diff_stats": {"files": 0, "added": 0, "deleted": 0},
         "changed_files": [],
-        "finished_at": now_utc(),
+        "finished_at": ts,
     }
 
 
 def _failed_render_payload(world: Dict[str, Any], branchpoint: Dict[str, Any], message: str) -> Dict[str, Any]:
+    ts = now_utc()
     return {
         "branchpoint_id": branchpoint["id"],
         "world_id": world["id"],
@@ -386,15 +430,40 @@ def _failed_render_payload(world: Dict[str, Any], branchpoint: Dict[str, Any], m
         "branch": world["branch"],
         "worktree": world["worktree"],
         "render_command": "",
-        "started_at": now_utc(),
+        "started_at": ts,
         "exit_code": None,
         "duration_sec": None,
         "render_log": None,
         "error": message,
-        "finished_at": now_utc(),
+        "finished_at": ts,
     }
 
 
+def _max_parallel_worlds(cfg: Dict[str, Any]) -> int:
+    value = int(cfg.get("execution", {}).get("max_parallel_worlds", 1))
+    if value > 0:
+        return value
+    # 0 = one world per CPU this process may actually run on (cgroup/taskset aware).
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:
+        return max(1, os.cpu_count() or 1)
+
+
+def _world_executor(worker_pool: str, worker_count: int) -> Executor:
+    if worker_pool != "process":
+        return ThreadPoolExecutor(max_workers=worker_count)
+    # Pipeline args/results are plain dicts, so they pickle cleanly; forkserver avoids
+    # forking a parent that may be holding locks (e.g. the threaded web backend).
+    # Imported here: multiprocessing is the heaviest import of a CLI start and only this pool needs it.
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    methods = multiprocessing.get_all_start_methods()
+    method = "forkserver" if "forkserver" in methods else "spawn"
+    return ProcessPoolExecutor(max_workers=worker_count, mp_context=multiprocessing.get_context(method))
+
+
 def _run_world_pipeline(
     world: Dict[str, Any],
     branchpoint: Dict[str, Any],
@@ -404,6 +473,7 @@ def _run_world_pipeline(
     commit_mode: str,
     commit_prefix: str,
     commit_target_count: int,
+    include_untracked: bool,
     runner_cmd: str,
     timeout_sec: int,
     skip_runner: bool,
@@ -419,7 +489,7 @@ def _run_world_pipeline(
             )
             if commit_mode == "series" and codex_result:
                 commit_count = int(codex_result.get("commit_count") or 0)
-                dirty_count = len(_collect_commit_candidate_paths(world.get("worktree", "")))
+                dirty_count = len(_collect_commit_candidate_paths(world.get("worktree", ""), include_untracked))
                 target = _series_commit_target(commit_target_count, dirty_count, files_per_commit=4)
                 needed = max(0, target - commit_count)
                 if needed > 0:
@@ -432,6 +502,7 @@ def _run_world_pipeline(
                         branchpoint_id=str(branchpoint.get("id", "")),
                         prefix=commit_prefix,
                         target_count=needed,
+                        include_untracked=include_untracked,
                     )
                     if shas:
                         codex_result["autocommit_shas"] = shas
@@ -481,6 +552,7 @@ def _apply_run_result(
     commit_mode: str,
     commit_prefix: str,
     commit_target_count: int,
+    include_untracked: bool = True,
 ) -> None:
     if codex_result:
         save_codex_run(repo, bp_id, world["id"], codex_result)
@@ -511,7 +583,7 @@ def _apply_run_result(
             world["status"] = "error"
         commit_count = int(codex_result.get("commit_count") or 0)
         if commit_mode == "series":
-            dirty_count = len(_collect_commit_candidate_paths(world.get("worktree", "")))
+            dirty_count = len(_collect_commit_candidate_paths(world.get("worktree", ""), include_untracked))
             target = _series_commit_target(commit_target_count, dirty_count, files_per_commit=4)
             needed = max(0, target - commit_count)
             if needed > 0:
@@ -524,6 +596,7 @@ def _apply_run_result(
                     branchpoint_id=bp_id,
                     prefix=commit_prefix,
                     target_count=needed,
+                    include_untracked=include_untracked,
                 )
                 if shas:
                     world["last_commit"] = shas[-1]
@@ -561,12 +634,14 @@ def run_branchpoint(
     commit_mode = str(codex_cfg.get("commit_mode", "series")).strip().lower() or "series"
     commit_target_count = max(1, int(codex_cfg.get("commit_target_count", 3) or 3))
     commit_prefix = str(codex_cfg.get("commit_prefix", "pw-step")).strip() or "pw-step"
+    include_untracked = bool(codex_cfg.get("autocommit_include_untracked", True))
 
     selected_worlds = resolve_worlds_for_branchpoint(repo, branchpoint, world_filters)
     available_skills: List[str] = []
     if codex_enabled and bool(codex_cfg.get("use_agents_md_skills", True)):
         available_skills = load_agents_skills(repo)
-    max_parallel = int(cfg.get("execution", {}).get("max_parallel_worlds", 1))
+    max_parallel = _max_parallel_worlds(cfg)
+    worker_pool = str(cfg.get("execution", {}).get("worker_pool", "thread"))
     worker_count = min(max_parallel, len(selected_worlds))
 
     if worker_count <= 1:
@@ -582,6 +657,7 @@ def run_branchpoint(
                 commit_mode=commit_mode,
                 commit_prefix=commit_prefix,
                 commit_target_count=commit_target_count,
+                include_untracked=include_untracked,
                 runner_cmd=runner_cmd,
                 timeout_sec=timeout_sec,
                 skip_runner=skip_runner,
@@ -595,13 +671,16 @@ def run_branchpoint(
                 commit_mode=commit_mode,
                 commit_prefix=commit_prefix,
                 commit_target_count=commit_target_count,
+                include_untracked=include_untracked,
             )
     else:
         for world in selected_worlds:
             world["status"] = "running"
             save_world(repo, world)
-        print(f"running {len(selected_worlds)} worlds with parallelism={worker_count}")
-        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        print(f"running {len(selected_worlds)} worlds with parallelism={worker_count} pool={worker_pool}")
+        # A single writer thread applies results so metadata saves and post-run commits
+        # overlap with worlds that are still running.
+        with _world_executor(worker_pool, worker_count) as executor, ThreadPoolExecutor(max_workers=1) as writer:
             futures = {
                 executor.submit(
                     _run_world_pipeline,
@@ -613,31 +692,39 @@ def run_branchpoint(
                     commit_mode,
                     commit_prefix,
                     commit_target_count,
+                    include_untracked,
                     runner_cmd,
                     timeout_sec,
                     skip_runner,
                 ): world["id"]
                 for world in selected_worlds
             }
+            applied = []
             for future in as_completed(futures):
                 world, codex_result, run_result = future.result()
-                _apply_run_result(
-                    repo,
-                    bp_id,
-                    world,
-                    codex_result,
-                    run_result,
-                    commit_mode=commit_mode,
-                    commit_prefix=commit_prefix,
-                    commit_target_count=commit_target_count,
+                applied.append(
+                    writer.submit(
+                        _apply_run_result,
+                        repo,
+                        bp_id,
+                        world,
+                        codex_result,
+                        run_result,
+                        commit_mode=commit_mode,
+                        commit_prefix=commit_prefix,
+                        commit_target_count=commit_target_count,
+                        include_untracked=include_untracked,
+                    )
                 )
+            for item in applied:
+                item.result()
 
     branchpoint["status"] = "ran"
     branchpoint["last_ran_at"] = now_utc()
     save_branchpoint(repo, branchpoint)
     set_latest_branchpoint(repo, bp_id)
 
-    build_report(config_path=config_path, branchpoint_id=bp_id)
+    _write_report(repo, cfg, bp_id, branchpoint)
 
 
 def build_playbook(config_path: str, branchpoint_id: Optional[str]) -> None:
@@ -646,50 +733,50 @@ def build_playbook(config_path: str, branchpoint_id: Optional[str]) -> None:
     ensure_metadata_dirs(repo)
 
     bp_id = resolve_branchpoint_id(repo, branchpoint_id)
-    branchpoint = load_branchpoint(repo, bp_id)
-    worlds = [load_world(repo, wid) for wid in branchpoint.get("world_ids", [])]
+    _write_playbook(repo, cfg, bp_id, load_branchpoint(repo, bp_id))
+
+
+def _write_playbook(repo: str, cfg: Dict[str, Any], bp_id: str, branchpoint: Dict[str, Any]) -> None:
+    world_ids = branchpoint.get("world_ids", [])
+    worlds = load_worlds(repo, world_ids)
+    renders = load_renders(repo, bp_id, world_ids)
 
     path = os.path.join(repo, "play.md")
-    lines: List[str] = []
-    lines.append("# Parallel Worlds Playback")
-    lines.append("")
-    lines.append(f"Generated: {now_utc()}")
-    lines.append(f"Branchpoint: `{bp_id}`")
-    lines.append(f"Intent: {branchpoint.get('intent', '')}")
-    lines.append(f"Render command: `{branchpoint.get('render') or cfg['render']['command']}`")
-    lines.append("")
+    preview_lines = int(cfg["render"]["preview_lines"])
+    buf = io.StringIO()
+    buf.write(
+        "# Parallel Worlds Playback\n\n"
+        f"Generated: {now_utc()}\n"
+        f"Branchpoint: `{bp_id}`\n"
+        f"Intent: {branchpoint.get('intent', '')}\n"
+        f"Render command: `{branchpoint.get('render') or cfg['render']['command']}`\n\n"
+    )
 
     for world in worlds:
-        render = load_render(repo, bp_id, world["id"])
-        lines.append(f"## {world['index']:02d} {world['name']}")
-        lines.append("")
-        lines.append(f"- World ID: `{world['id']}`")
-        lines.append(f"- Branch: `{world['branch']}`")
-        lines.append(f"- Worktree: `{world['worktree']}`")
+        render = renders.get(world["id"])
+        buf.write(
+            f"## {world['index']:02d} {world['name']}\n\n"
+            f"- World ID: `{world['id']}`\n"
+            f"- Branch: `{world['branch']}`\n"
+            f"- Worktree: `{world['worktree']}`\n"
+        )
         if not render:
-            lines.append("- Render: not run")
-            lines.append("")
+            buf.write("- Render: not run\n\n")
             continue
 
-        lines.append(f"- Exit: `{render.get('exit_code')}`")
-        lines.append(f"- Duration: `{render.get('duration_sec')}` sec")
+        buf.write(f"- Exit: `{render.get('exit_code')}`\n- Duration: `{render.get('duration_sec')}` sec\n")
         if render.get("error"):
-            lines.append(f"- Error: `{render.get('error')}`")
-        log_path = format_path(render.get("render_log"), repo)
-        lines.append(f"- Log: `{log_path}`")
-        lines.append("")
+            buf.write(f"- Error: `{render.get('error')}`\n")
+        buf.write(f"- Log: `{format_path(render.get('render_log'), repo)}`\n\n")
 
-        preview = tail_file(render.get("render_log", ""), int(cfg["render"]["preview_lines"]))
+        preview = tail_file(render.get("render_log", ""), preview_lines)
         if preview:
-            lines.append("Execution preview:")
-            lines.append("")
-            lines.append("```text")
-            lines.extend(preview)
-            lines.append("```")
-            lines.append("")
+            buf.write("Execution preview:\n\n```text\n")
+            buf.write("\n".join(preview))
+            buf.write("\n```\n\n")
 
     with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines) + "\n")
+        f.write(buf.getvalue())
 
     print(f"playbook written: {path}")
 
@@ -716,16 +803,17 @@ def _apply_render_result(
         world["status"] = "fail"
     save_world(repo, world)
 
-    print(
+    lines = [
         f"played {world['id']}: exit={result.get('exit_code')} "
         f"duration={result.get('duration_sec')} error={result.get('error')}"
-    )
+    ]
     preview = tail_file(result.get("render_log", "") or "", preview_lines)
     if preview:
-        print(f"--- preview: {world['id']} ---")
-        for line in preview:
-            print(line)
-        print("--- end preview ---")
+        lines.append(f"--- preview: {world['id']} ---")
+        lines.extend(preview)
+        lines.append("--- end preview ---")
+    # One write per world keeps the preview block contiguous and cheap to stream into job logs.
+    print("\n".join(lines))
 
 
 def play_branchpoint(
@@ -755,7 +843,8 @@ def play_branchpoint(
     if preview_lines < 0:
         die("preview lines must be >= 0")
 
-    max_parallel = int(cfg.get("execution", {}).get("max_parallel_worlds", 1))
+    max_parallel = _max_parallel_worlds(cfg)
+    worker_pool = str(cfg.get("execution", {}).get("worker_pool", "thread"))
     worker_count = min(max_parallel, len(selected_worlds))
 
     if worker_count <= 1:
@@ -768,8 +857,8 @@ def play_branchpoint(
             )
             _apply_render_result(repo, bp_id, world, result, preview_lines)
     else:
-        print(f"playing {len(selected_worlds)} worlds with parallelism={worker_count}")
-        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        print(f"playing {len(selected_worlds)} worlds with parallelism={worker_count} pool={worker_pool}")
+        with _world_executor(worker_pool, worker_count) as executor, ThreadPoolExecutor(max_workers=1) as writer:
             futures = {
                 executor.submit(
                     _play_world_pipeline,
@@ -780,9 +869,12 @@ def play_branchpoint(
                 ): world["id"]
                 for world in selected_worlds
             }
+            applied = []
             for future in as_completed(futures):
                 world, result = future.result()
-                _apply_render_result(repo, bp_id, world, result, preview_lines)
+                applied.append(writer.submit(_apply_render_result, repo, bp_id, world, result, preview_lines))
+            for item in applied:
+                item.result()
 
     branchpoint["status"] = "played"
     branchpoint["last_played_at"] = now_utc()
@@ -790,13 +882,16 @@ def play_branchpoint(
     save_branchpoint(repo, branchpoint)
     set_latest_branchpoint(repo, bp_id)
 
-    build_playbook(config_path=config_path, branchpoint_id=bp_id)
-    build_report(config_path=config_path, branchpoint_id=bp_id)
+    _write_playbook(repo, cfg, bp_id, branchpoint)
+    _write_report(repo, cfg, bp_id, branchpoint)
+
+
+_UNSCORED = (3, 1, 999999.0, 999999)
 
 
 def world_score(run: Optional[Dict[str, Any]]) -> Tuple[int, int, float, int]:
     if run is None:
-        return (3, 1, 999999.0, 999999)
+        return _UNSCORED
 
     exit_code = run.get("exit_code")
     error = run.get("error")
@@ -820,59 +915,81 @@ def format_path(path: Optional[str], repo: str) -> str:
     return relative_to_repo(path, repo)
 
 
+_REPORT_HEADER = (
+    "## Comparison\n\n"
+    "| Rank | World | Branch | Status | Codex Exit | Codex Duration (s) | Test Exit | Test Duration (s) | Render Exit | Render Duration (s) | Files | +Lines | -Lines | Strategy | Prompt | Codex Log | Trace | Render Log | Diff |\n"
+    "| --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- |\n"
+)
+_REPORT_ROW = "| {} | {} | `{}` | {} | {} | {} | {} | {} | {} | {} | {} | {} | {} | {} | {} | {} | {} | {} | {} |\n".format
+
+
 def build_report(config_path: str, branchpoint_id: Optional[str]) -> None:
     repo = ensure_git_repo()
     cfg = load_config(config_path)
     ensure_metadata_dirs(repo)
 
     bp_id = resolve_branchpoint_id(repo, branchpoint_id)
-    branchpoint = load_branchpoint(repo, bp_id)
+    _write_report(repo, cfg, bp_id, load_branchpoint(repo, bp_id))
 
-    worlds: List[Dict[str, Any]] = [load_world(repo, wid) for wid in branchpoint.get("world_ids", [])]
 
-    ranked = []
-    for world in worlds:
-        run = load_run(repo, bp_id, world["id"])
-        codex_run = load_codex_run(repo, bp_id, world["id"])
-        render = load_render(repo, bp_id, world["id"])
-        ranked.append((world_score(run), world, run, codex_run, render))
-    ranked.sort(key=lambda x: x[0])
+def _write_report(
+    repo: str,
+    cfg: Dict[str, Any],
+    bp_id: str,
+    branchpoint: Dict[str, Any],
+    worlds: Optional[List[Dict[str, Any]]] = None,
+) -> None:
+    # Commands that already hold the repo, config and branchpoint call this directly
+    # instead of re-resolving everything through build_report.
+    world_ids = branchpoint.get("world_ids", [])
+    if worlds is None:
+        worlds = load_worlds(repo, world_ids)
+    runs = load_runs(repo, bp_id, world_ids)
+    codex_runs = load_codex_runs(repo, bp_id, world_ids)
+    renders = load_renders(repo, bp_id, world_ids)
+
+    ids = [world["id"] for world in worlds]
+    run_rows = [runs.get(wid) for wid in ids]
+    ranked = sorted(
+        zip(
+            map(world_score, run_rows),
+            worlds,
+            run_rows,
+            [codex_runs.get(wid) for wid in ids],
+            [renders.get(wid) for wid in ids],
+        ),
+        key=itemgetter(0),
+    )
 
     report_path = os.path.join(repo, "report.md")
-    lines: List[str] = []
-    lines.append("# Parallel Worlds Report")
-    lines.append("")
-    lines.append(f"Generated: {now_utc()}")
-    lines.append(f"Branchpoint: `{bp_id}`")
-    lines.append(f"Intent: {branchpoint.get('intent', '')}")
-    lines.append(f"Source ref: `{branchpoint.get('source_ref', '')}`")
-    lines.append(f"Base branch: `{branchpoint.get('base_branch', cfg['base_branch'])}`")
-    lines.append(f"Runner: `{cfg['runner']['command']}`")
-    lines.append(f"Codex: `{cfg['codex']['command']}` (enabled={cfg['codex']['enabled']})")
-    lines.append(f"Render: `{cfg['render']['command']}`")
-    lines.append("")
-
-    lines.append("## Branch Graph")
-    lines.append("")
-    lines.append("```mermaid")
-    lines.append("graph TD")
-    lines.append(f"  SRC[\"{branchpoint.get('source_ref', 'source')}\"]")
-    lines.append(f"  BP[\"{bp_id}\"]")
-    lines.append("  SRC --> BP")
-    for _, world, _, _, _ in ranked:
-        label = f"{world['index']:02d} {world['name']}"
-        node = f"W{world['index']:02d}"
-        lines.append(f"  BP --> {node}[\"{label}\"]")
-    lines.append("```")
-    lines.append("")
+    base_branch = branchpoint.get("base_branch", cfg["base_branch"])
+    buf = io.StringIO()
+    buf.write(
+        "# Parallel Worlds Report\n\n"
+        f"Generated: {now_utc()}\n"
+        f"Branchpoint: `{bp_id}`\n"
+        f"Intent: {branchpoint.get('intent', '')}\n"
+        f"Source ref: `{branchpoint.get('source_ref', '')}`\n"
+        f"Base branch: `{base_branch}`\n"
+        f"Runner: `{cfg['runner']['command']}`\n"
+        f"Codex: `{cfg['codex']['command']}` (enabled={cfg['codex']['enabled']})\n"
+        f"Render: `{cfg['render']['command']}`\n\n"
+    )
 
-    lines.append("## Comparison")
-    lines.append("")
-    lines.append("| Rank | World | Branch | Status | Codex Exit | Codex Duration (s) | Test Exit | Test Duration (s) | Render Exit | Render Duration (s) | Files | +Lines | -Lines | Strategy | Prompt | Codex Log | Trace | Render Log | Diff |")
-    lines.append("| --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- |")
+    buf.write(
+        "## Branch Graph\n\n"
+        "```mermaid\n"
+        "graph TD\n"
+        f"  SRC[\"{branchpoint.get('source_ref', 'source')}\"]\n"
+        f"  BP[\"{bp_id}\"]\n"
+        "  SRC --> BP\n"
+    )
+    for _, world, _, _, _ in ranked:
+        buf.write(f"  BP --> W{world['index']:02d}[\"{world['index']:02d} {world['name']}\"]\n")
+    buf.write("```\n\n")
 
+    buf.write(_REPORT_HEADER)
     for rank, (_, world, run, codex_run, render) in enumerate(ranked, start=1):
-        status = world.get("status", "ready")
         codex_exit = ""
         codex_duration = ""
         run_exit = ""
@@ -907,13 +1024,31 @@ def build_report(config_path: str, branchpoint_id: Optional[str]) -> None:
             render_duration = str(render.get("duration_sec", ""))
             render_log = f"`{format_path(render.get('render_log'), repo)}`" if render.get("render_log") else ""
 
-        lines.append(
-            f"| {rank} | {world['name']} | `{world['branch']}` | {status} | {codex_exit} | {codex_duration} | {run_exit} | {run_duration} | {render_exit} | {render_duration} | {files} | {added} | {deleted} | {world.get('notes','')} | {prompt} | {codex_log} | {trace} | {render_log} | {diff} |"
+        buf.write(
+            _REPORT_ROW(
+                rank,
+                world["name"],
+                world["branch"],
+                world.get("status", "ready"),
+                codex_exit,
+                codex_duration,
+                run_exit,
+                run_duration,
+                render_exit,
+                render_duration,
+                files,
+                added,
+                deleted,
+                world.get("notes", ""),
+                prompt,
+                codex_log,
+                trace,
+                render_log,
+                diff,
+            )
         )
 
-    lines.append("")
-    lines.append("Playback details: `play.md` (generated by `pw.py play`).")
-    lines.append("")
+    buf.write("\nPlayback details: `play.md` (generated by `pw.py play`).\n\n")
     selected_world_id = branchpoint.get("selected_world_id")
     if selected_world_id:
         selected = None
@@ -922,21 +1057,19 @@ def build_report(config_path: str, branchpoint_id: Optional[str]) -> None:
                 selected = world
                 break
         if selected:
-            lines.append("## Selected World")
-            lines.append("")
-            lines.append(f"Selected: `{selected['id']}`")
-            lines.append(f"Branch: `{selected['branch']}`")
-            lines.append("")
-            lines.append("Suggested merge command:")
-            lines.append("")
-            lines.append("```bash")
-            lines.append(f"git checkout {branchpoint.get('base_branch', cfg['base_branch'])}")
-            lines.append(f"git merge --no-ff {selected['branch']}")
-            lines.append("```")
-            lines.append("")
+            buf.write(
+                "## Selected World\n\n"
+                f"Selected: `{selected['id']}`\n"
+                f"Branch: `{selected['branch']}`\n\n"
+                "Suggested merge command:\n\n"
+                "```bash\n"
+                f"git checkout {base_branch}\n"
+                f"git merge --no-ff {selected['branch']}\n"
+                "```\n\n"
+            )
 
     with open(report_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines) + "\n")
+        f.write(buf.getvalue())
 
     print(f"report written: {report_path}")
 
@@ -949,7 +1082,7 @@ def print_status(config_path: str, branchpoint_id: Optional[str]) -> None:
     bp_id = resolve_branchpoint_id(repo, branchpoint_id)
     branchpoint = load_branchpoint(repo, bp_id)
 
-    worlds = [load_world(repo, wid) for wid in branchpoint.get("world_ids", [])]
+    worlds = load_worlds(repo, branchpoint.get("world_ids", []))
 
     counts = {"ready": 0, "pass": 0, "fail": 0, "error": 0, "skipped": 0}
     for w in worlds:
@@ -991,10 +1124,13 @@ def list_objects(config_path: str, show_worlds: bool) -> None:
             )
         return
 
+    # All worlds share one metadata dir, so load them in a single batched read.
+    all_ids = [wid for bp in branchpoints for wid in bp.get("world_ids", [])]
+    worlds_by_id = dict(zip(all_ids, load_worlds(repo, all_ids)))
     for bp in branchpoints:
         print(f"{bp['id']}\t{bp.get('created_at','')}\t{bp.get('intent','')}")
         for wid in bp.get("world_ids", []):
-            world = load_world(repo, wid)
+            world = worlds_by_id[wid]
             print(
                 f"  - {world['id']}\t{world.get('status','ready')}\t"
                 f"{world['branch']}\t{world['worktree']}\t"
@@ -1004,11 +1140,16 @@ def list_objects(config_path: str, show_worlds: bool) -> None:
 
 
 def resolve_world_choice(worlds: List[Dict[str, Any]], world_token: str) -> Dict[str, Any]:
+    index: Dict[str, Dict[str, Any]] = {}
     for world in worlds:
-        if world_token in {world.get("id"), world.get("slug"), world.get("name"), world.get("branch")}:
-            return world
-    die(f"world not found in branchpoint: {world_token}")
-    return {}
+        for key in ("id", "slug", "name", "branch"):
+            value = world.get(key)
+            if value:
+                index.setdefault(value, world)
+    selected = index.get(world_token)
+    if selected is None:
+        die(f"world not found in branchpoint: {world_token}")
+    return selected
 
 
 def select_world(config_path: str, branchpoint_id: Optional[str], world_token: str, merge: bool, target_branch: Optional[str]) -> None:
@@ -1019,7 +1160,7 @@ def select_world(config_path: str, branchpoint_id: Optional[str], world_token: s
     bp_id = resolve_branchpoint_id(repo, branchpoint_id)
     branchpoint = load_branchpoint(repo, bp_id)
 
-    worlds = [load_world(repo, wid) for wid in branchpoint.get("world_ids", [])]
+    worlds = load_worlds(repo, branchpoint.get("world_ids", []))
     selected = resolve_world_choice(worlds, world_token)
 
     branchpoint["selected_world_id"] = selected["id"]
@@ -1042,7 +1183,7 @@ def select_world(config_path: str, branchpoint_id: Optional[str], world_token: s
         git(["merge", "--no-ff", selected["branch"]], cwd=repo, check=True)
         print(f"merged {selected['branch']} into {target}")
 
-    build_report(config_path=config_path, branchpoint_id=bp_id)
+    _write_report(repo, cfg, bp_id, branchpoint, worlds)
 
 
 def refork_world(
@@ -1058,7 +1199,7 @@ def refork_world(
 
     bp_id = resolve_branchpoint_id(repo, branchpoint_id)
     branchpoint = load_branchpoint(repo, bp_id)
-    worlds = [load_world(repo, wid) for wid in branchpoint.get("world_ids", [])]
+    worlds = load_worlds(repo, branchpoint.get("world_ids", []))
     selected = resolve_world_choice(worlds, world_token)
 
     kickoff_worlds(
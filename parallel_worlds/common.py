@@ -1,15 +1,18 @@
-import copy
+import functools
 import json
 import os
 import re
 import subprocess
 import sys
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from .git_batch import repo_batch
 
 
 def now_utc() -> str:
-    return datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def die(message: str) -> None:
@@ -36,9 +39,33 @@ def git(args: List[str], cwd: Optional[str] = None, check: bool = True) -> subpr
     return run_cmd(["git"] + args, cwd=cwd, check=check)
 
 
+def git_ok(args: List[str], cwd: Optional[str] = None) -> bool:
+    # Exit-status-only probes: no pipes to drain and nothing to decode.
+    result = subprocess.run(["git"] + args, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return result.returncode == 0
+
+
+def git_bytes(args: List[str], cwd: Optional[str] = None, check: bool = True) -> subprocess.CompletedProcess:
+    return subprocess.run(["git"] + args, cwd=cwd, capture_output=True, check=check)
+
+
+def git_to_file(args: List[str], path: str, cwd: Optional[str] = None) -> int:
+    # Output goes straight from git's stdout into the file; nothing is buffered or decoded here.
+    with open(path, "wb") as f:
+        return subprocess.run(["git"] + args, cwd=cwd, stdout=f, stderr=subprocess.DEVNULL, check=False).returncode
+
+
+_REPO_ROOTS: Dict[str, str] = {}
+
+
 def repo_root() -> str:
-    result = git(["rev-parse", "--show-toplevel"], check=True)
-    return result.stdout.strip()
+    # Keyed on cwd: the web backend chdirs between projects within one process.
+    cwd = os.getcwd()
+    root = _REPO_ROOTS.get(cwd)
+    if root is None:
+        result = git(["rev-parse", "--show-toplevel"], check=True)
+        root = _REPO_ROOTS[cwd] = result.stdout.strip()
+    return root
 
 
 def ensure_git_repo() -> str:
@@ -53,34 +80,85 @@ def read_json(path: str) -> Dict[str, Any]:
         return json.load(f)
 
 
-def write_json(path: str, payload: Dict[str, Any]) -> None:
+def write_text_atomic(path: str, text: str) -> None:
+    # Readers (other commands, the web backend) never observe a half-written file.
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
-        f.write("\n")
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def write_json(path: str, payload: Dict[str, Any]) -> None:
+    write_text_atomic(path, json.dumps(payload, indent=2) + "\n")
+
+
+_NO_OVERRIDE: Dict[str, Any] = {}
+
+
+def clone_json(value: Any) -> Any:
+    # Deep copy for JSON-shaped data (dicts, lists, scalars); much cheaper than copy.deepcopy.
+    if isinstance(value, dict):
+        return {key: clone_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [clone_json(item) for item in value]
+    return value
 
 
 def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    merged = copy.deepcopy(base)
-    for key, value in override.items():
-        if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-            merged[key] = deep_merge(merged[key], value)
-        else:
-            merged[key] = value
+    # Iterative and copy-on-write: base subtrees replaced by the override are never copied,
+    # and only non-dict containers (e.g. strategy lists) go through deepcopy.
+    import copy
+
+    merged: Dict[str, Any] = {}
+    stack = [(merged, base, override)]
+    while stack:
+        dst, src, over = stack.pop()
+        for key, value in src.items():
+            if key in over:
+                new = over[key]
+                if isinstance(value, dict) and isinstance(new, dict):
+                    dst[key] = {}
+                    stack.append((dst[key], value, new))
+                else:
+                    dst[key] = new
+            elif isinstance(value, dict):
+                dst[key] = {}
+                stack.append((dst[key], value, _NO_OVERRIDE))
+            elif isinstance(value, list):
+                dst[key] = copy.deepcopy(value)
+            else:
+                dst[key] = value
+        for key, value in over.items():
+            if key not in src:
+                dst[key] = value
     return merged
 
 
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+
+@functools.lru_cache(maxsize=1024)
 def slugify(name: str) -> str:
-    slug = re.sub(r"[^a-zA-Z0-9]+", "-", name.strip().lower()).strip("-")
+    slug = _SLUG_RE.sub("-", name.strip().lower()).strip("-")
     return slug or "world"
 
 
 def is_subpath(path: str, parent: str) -> bool:
     path = os.path.realpath(path)
     parent = os.path.realpath(parent)
-    return os.path.commonpath([path, parent]) == parent
+    # Both sides are normalized absolute paths, so a separator-bounded prefix test is exact.
+    return path == parent or path.startswith(parent.rstrip(os.sep) + os.sep)
 
 
+@functools.lru_cache(maxsize=None)
 def git_common_dir(repo: str) -> str:
     common = git(["rev-parse", "--git-common-dir"], cwd=repo, check=True).stdout.strip()
     if not os.path.isabs(common):
@@ -88,6 +166,76 @@ def git_common_dir(repo: str) -> str:
     return common
 
 
+_OBJECT_ID_RE = re.compile(r"[0-9a-f]{40}([0-9a-f]{24})?")
+
+
+def _read_first_line(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.readline().strip()
+
+
+def _git_dirs(worktree: str) -> Tuple[str, str]:
+    # (per-worktree git dir, common dir); a linked worktree's .git is a "gitdir:" pointer file.
+    gitdir = os.path.join(worktree, ".git")
+    if os.path.isfile(gitdir):
+        pointer = _read_first_line(gitdir)
+        if not pointer.startswith("gitdir: "):
+            raise FileNotFoundError(gitdir)
+        gitdir = os.path.join(worktree, pointer[len("gitdir: "):])
+    try:
+        common = os.path.join(gitdir, _read_first_line(os.path.join(gitdir, "commondir")))
+    except FileNotFoundError:
+        common = gitdir
+    return gitdir, common
+
+
+def _ref_from_files(common: str, ref: str) -> Optional[str]:
+    try:
+        value = _read_first_line(os.path.join(common, ref))
+        return value if _OBJECT_ID_RE.fullmatch(value) else None
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    with open(os.path.join(common, "packed-refs"), "r", encoding="utf-8") as f:
+        for line in f:
+            sha, _, name = line.rstrip("\n").partition(" ")
+            if name == ref and _OBJECT_ID_RE.fullmatch(sha):
+                return sha
+    return None
+
+
+def _head_from_files(worktree: str) -> Optional[str]:
+    # Plain files only: <gitdir>/HEAD -> loose ref or packed-refs in the common dir.
+    # Anything unexpected (reftable, nested symrefs, unborn branch) returns None.
+    try:
+        gitdir, common = _git_dirs(worktree)
+        head = _read_first_line(os.path.join(gitdir, "HEAD"))
+        if not head.startswith("ref: "):
+            return head if _OBJECT_ID_RE.fullmatch(head) else None
+        return _ref_from_files(common, head[len("ref: "):])
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def local_branch_commit(worktree: str, branch: str) -> Optional[str]:
+    # File-only lookup of refs/heads/<branch>; None means "not resolvable this way", not "missing".
+    try:
+        _, common = _git_dirs(worktree)
+        return _ref_from_files(common, f"refs/heads/{branch}")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def head_commit(worktree: str) -> Optional[str]:
+    # Reading HEAD from the git dir costs a few small reads instead of a git process.
+    sha = _head_from_files(worktree)
+    if sha is not None:
+        return sha
+    result = git(["rev-parse", "--verify", "--quiet", "HEAD"], cwd=worktree, check=False)
+    if result.returncode != 0:
+        return None
+    return (result.stdout or "").strip() or None
+
+
 def relative_to_repo(path: str, repo: str) -> str:
     try:
         return os.path.relpath(path, repo)
@@ -96,18 +244,23 @@ def relative_to_repo(path: str, repo: str) -> str:
 
 
 def branch_exists(name: str, repo: str) -> bool:
-    result = git(["show-ref", "--verify", "--quiet", f"refs/heads/{name}"], cwd=repo, check=False)
-    return result.returncode == 0
+    return repo_batch(repo).exists(f"refs/heads/{name}")
+
+
+def _rev_exists(rev: str, repo: str) -> bool:
+    # The batch protocol is line/space delimited, so revisions like "main@{2 days ago}"
+    # go through a one-off rev-parse instead.
+    if any(ch.isspace() for ch in rev.strip()):
+        return git_ok(["rev-parse", "--verify", "--quiet", rev], cwd=repo)
+    return repo_batch(repo).exists(rev)
 
 
 def ref_exists(ref: str, repo: str) -> bool:
-    result = git(["rev-parse", "--verify", "--quiet", ref], cwd=repo, check=False)
-    return result.returncode == 0
+    return _rev_exists(ref, repo)
 
 
 def commit_exists(ref: str, repo: str) -> bool:
-    result = git(["rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"], cwd=repo, check=False)
-    return result.returncode == 0
+    return _rev_exists(f"{ref}^{{commit}}", repo)
 
 
 def current_branch(repo: str) -> Optional[str]:
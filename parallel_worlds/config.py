@@ -1,8 +1,10 @@
 import json
 import os
-from typing import Any, Dict
+import threading
+import time
+from typing import Any, Dict, Tuple
 
-from .common import deep_merge, die
+from .common import clone_json, deep_merge, die
 from .render_helper import DEFAULT_RENDER_COMMAND
 from .runner_helper import DEFAULT_RUNNER_COMMAND
 
@@ -24,6 +26,7 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "commit_mode": "series",
         "commit_target_count": 3,
         "commit_prefix": "pw-step",
+        "autocommit_include_untracked": True,
         "automation": {
             "enabled": False,
             "name_prefix": "Parallel Worlds",
@@ -37,6 +40,7 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "execution": {
         "max_parallel_worlds": 4,
         "workspace_mode": "worktree",
+        "worker_pool": "thread",
     },
     "strategies": [
         {
@@ -54,23 +58,76 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     ],
 }
 
-PLACEHOLDER_STRATEGY_NAMES = {"approach-a", "approach-b", "approach-c"}
+PLACEHOLDER_STRATEGY_NAMES = frozenset({"approach-a", "approach-b", "approach-c"})
+
+# Validation tables walked by load_config; a section of None means the config root.
+_REQUIRED_STRINGS = ("base_branch", "branch_prefix", "worlds_dir")
+_SECTIONS = ("runner", "codex", "render", "execution")
+_COMMAND_SECTIONS = ("runner", "codex", "render")
+# (section, key, default, minimum, message used when below minimum)
+_INT_FIELDS = (
+    (None, "default_world_count", 3, 1, ">= 1"),
+    ("runner", "timeout_sec", 300, 1, "> 0"),
+    ("codex", "timeout_sec", 900, 1, "> 0"),
+    ("codex", "commit_target_count", 3, 1, ">= 1"),
+    ("render", "timeout_sec", 180, 1, "> 0"),
+    ("render", "preview_lines", 25, 0, ">= 0"),
+    ("execution", "max_parallel_worlds", 4, 0, ">= 0 (0 = one per usable CPU)"),
+)
+# (section, key, default, allowed values)
+_ENUM_FIELDS = (
+    ("codex", "commit_mode", "series", ("single", "series")),
+    ("execution", "workspace_mode", "worktree", ("branch", "worktree")),
+    ("execution", "worker_pool", "thread", ("thread", "process")),
+)
+_FLAG_FIELDS = (
+    ("codex", "enabled", False),
+    ("codex", "use_agents_md_skills", True),
+    ("codex", "autocommit_include_untracked", True),
+)
+
+# Validated configs keyed by absolute path, reused while (mtime_ns, size) is unchanged.
+# Same racy-clean rule as the metadata cache in state.py.
+_CONFIG_RACY_WINDOW_NS = 2_000_000_000
+_CONFIG_CACHE_LOCK = threading.Lock()
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
 
 
 def write_default_config(path: str, force: bool) -> None:
-    if os.path.exists(path) and not force:
+    # Exclusive create unless forced: one open() and no exists()/open() race.
+    try:
+        f = open(path, "w" if force else "x", encoding="utf-8")
+    except FileExistsError:
         die(f"config already exists: {path}. Use --force to overwrite.")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(DEFAULT_CONFIG, f, indent=2)
-        f.write("\n")
+    with f:
+        f.write(json.dumps(DEFAULT_CONFIG, indent=2) + "\n")
 
 
 def load_config(path: str) -> Dict[str, Any]:
-    if not os.path.exists(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
         die(f"config not found: {path}")
+    cache_path = os.path.abspath(path)
+    key = (st.st_mtime_ns, st.st_size)
+    with _CONFIG_CACHE_LOCK:
+        hit = _CONFIG_CACHE.get(cache_path)
+    if hit is not None and hit[0] == key:
+        return clone_json(hit[1])
+
+    cfg = _parse_config(path)
+    if time.time_ns() - st.st_mtime_ns > _CONFIG_RACY_WINDOW_NS:
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE[cache_path] = (key, clone_json(cfg))
+    return cfg
+
+
+def _parse_config(path: str) -> Dict[str, Any]:
     try:
         with open(path, "r", encoding="utf-8") as f:
             user = json.load(f)
+    except FileNotFoundError:
+        die(f"config not found: {path}")
     except json.JSONDecodeError as exc:
         die(f"invalid config JSON: {exc}")
 
@@ -79,124 +136,56 @@ def load_config(path: str) -> Dict[str, Any]:
 
     cfg = deep_merge(DEFAULT_CONFIG, user)
 
-    if not isinstance(cfg.get("base_branch"), str) or not cfg["base_branch"].strip():
-        die("config.base_branch must be a non-empty string")
-    if not isinstance(cfg.get("branch_prefix"), str) or not cfg["branch_prefix"].strip():
-        die("config.branch_prefix must be a non-empty string")
-    if not isinstance(cfg.get("worlds_dir"), str) or not cfg["worlds_dir"].strip():
-        die("config.worlds_dir must be a non-empty string")
+    for key in _REQUIRED_STRINGS:
+        if not isinstance(cfg.get(key), str) or not cfg[key].strip():
+            die(f"config.{key} must be a non-empty string")
+    for section in _SECTIONS:
+        if not isinstance(cfg.get(section), dict):
+            die(f"config.{section} must be an object")
+    codex = cfg["codex"]
+    automation = codex.get("automation", {})
+    if not isinstance(automation, dict):
+        die("config.codex.automation must be an object")
 
-    try:
-        cfg["default_world_count"] = int(cfg.get("default_world_count", 3))
-    except (TypeError, ValueError):
-        die("config.default_world_count must be an integer")
-    if cfg["default_world_count"] < 1:
-        die("config.default_world_count must be >= 1")
-
-    runner = cfg.get("runner", {})
-    if not isinstance(runner, dict):
-        die("config.runner must be an object")
-
-    runner_cmd = runner.get("command", "")
-    if not isinstance(runner_cmd, str):
-        die("config.runner.command must be a string")
-    if not runner_cmd.strip():
-        runner_cmd = str(DEFAULT_CONFIG["runner"]["command"])
+    for section, key, default, minimum, bound in _INT_FIELDS:
+        target = cfg[section] if section else cfg
+        name = f"config.{section}.{key}" if section else f"config.{key}"
+        try:
+            value = int(target.get(key, default))
+        except (TypeError, ValueError):
+            die(f"{name} must be an integer")
+        if value < minimum:
+            die(f"{name} must be {bound}")
+        target[key] = value
+
+    for section in _COMMAND_SECTIONS:
+        command = cfg[section].get("command", "")
+        if not isinstance(command, str):
+            die(f"config.{section}.command must be a string")
+        if not command.strip():
+            command = str(DEFAULT_CONFIG[section]["command"])
+        cfg[section]["command"] = command
+
+    for section, key, default, allowed in _ENUM_FIELDS:
+        value = str(cfg[section].get(key, default)).strip().lower() or default
+        if value not in allowed:
+            choices = " or ".join(f"'{item}'" for item in allowed)
+            die(f"config.{section}.{key} must be {choices}")
+        cfg[section][key] = value
+
+    for section, key, default in _FLAG_FIELDS:
+        cfg[section][key] = bool(cfg[section].get(key, default))
 
-    try:
-        timeout = int(runner.get("timeout_sec", 300))
-    except (TypeError, ValueError):
-        die("config.runner.timeout_sec must be an integer")
-    if timeout <= 0:
-        die("config.runner.timeout_sec must be > 0")
-    cfg["runner"]["command"] = runner_cmd
-    cfg["runner"]["timeout_sec"] = timeout
-
-    codex = cfg.get("codex", {})
-    if not isinstance(codex, dict):
-        die("config.codex must be an object")
-    codex_enabled = bool(codex.get("enabled", False))
-    codex_command = codex.get("command", "")
-    if not isinstance(codex_command, str):
-        die("config.codex.command must be a string")
-    if not codex_command.strip():
-        codex_command = str(DEFAULT_CONFIG["codex"]["command"])
-    try:
-        codex_timeout = int(codex.get("timeout_sec", 900))
-    except (TypeError, ValueError):
-        die("config.codex.timeout_sec must be an integer")
-    if codex_timeout <= 0:
-        die("config.codex.timeout_sec must be > 0")
-    use_agents_md_skills = bool(codex.get("use_agents_md_skills", True))
-    commit_mode = str(codex.get("commit_mode", "series")).strip().lower() or "series"
-    if commit_mode not in {"single", "series"}:
-        die("config.codex.commit_mode must be 'single' or 'series'")
-    try:
-        commit_target_count = int(codex.get("commit_target_count", 3))
-    except (TypeError, ValueError):
-        die("config.codex.commit_target_count must be an integer")
-    if commit_target_count < 1:
-        die("config.codex.commit_target_count must be >= 1")
     commit_prefix = str(codex.get("commit_prefix", "pw-step")).strip()
     if not commit_prefix:
         die("config.codex.commit_prefix must be a non-empty string")
+    codex["commit_prefix"] = commit_prefix
 
-    automation = codex.get("automation", {})
-    if not isinstance(automation, dict):
-        die("config.codex.automation must be an object")
-    automation_enabled = bool(automation.get("enabled", False))
     automation_name_prefix = str(automation.get("name_prefix", "Parallel Worlds")).strip()
     if not automation_name_prefix:
         die("config.codex.automation.name_prefix must be a non-empty string")
-
-    cfg["codex"]["enabled"] = codex_enabled
-    cfg["codex"]["command"] = codex_command
-    cfg["codex"]["timeout_sec"] = codex_timeout
-    cfg["codex"]["use_agents_md_skills"] = use_agents_md_skills
-    cfg["codex"]["commit_mode"] = commit_mode
-    cfg["codex"]["commit_target_count"] = commit_target_count
-    cfg["codex"]["commit_prefix"] = commit_prefix
-    cfg["codex"]["automation"]["enabled"] = automation_enabled
-    cfg["codex"]["automation"]["name_prefix"] = automation_name_prefix
-
-    render = cfg.get("render", {})
-    if not isinstance(render, dict):
-        die("config.render must be an object")
-    render_cmd = render.get("command", "")
-    if not isinstance(render_cmd, str):
-        die("config.render.command must be a string")
-    if not render_cmd.strip():
-        render_cmd = str(DEFAULT_CONFIG["render"]["command"])
-    try:
-        render_timeout = int(render.get("timeout_sec", 180))
-    except (TypeError, ValueError):
-        die("config.render.timeout_sec must be an integer")
-    if render_timeout <= 0:
-        die("config.render.timeout_sec must be > 0")
-    try:
-        preview_lines = int(render.get("preview_lines", 25))
-    except (TypeError, ValueError):
-        die("config.render.preview_lines must be an integer")
-    if preview_lines < 0:
-        die("config.render.preview_lines must be >= 0")
-    cfg["render"]["command"] = render_cmd
-    cfg["render"]["timeout_sec"] = render_timeout
-    cfg["render"]["preview_lines"] = preview_lines
-
-    execution = cfg.get("execution", {})
-    if not isinstance(execution, dict):
-        die("config.execution must be an object")
-    try:
-        max_parallel = int(execution.get("max_parallel_worlds", 4))
-    except (TypeError, ValueError):
-        die("config.execution.max_parallel_worlds must be an integer")
-    if max_parallel < 1:
-        die("config.execution.max_parallel_worlds must be >= 1")
-    cfg["execution"]["max_parallel_worlds"] = max_parallel
-    workspace_mode = str(execution.get("workspace_mode", "worktree")).strip().lower() or "worktree"
-    if workspace_mode not in {"branch", "worktree"}:
-        die("config.execution.workspace_mode must be 'branch' or 'worktree'")
-    cfg["execution"]["workspace_mode"] = workspace_mode
+    automation["enabled"] = bool(automation.get("enabled", False))
+    automation["name_prefix"] = automation_name_prefix
 
     strategies = cfg.get("strategies", [])
     if not isinstance(strategies, list):
@@ -1,12 +1,17 @@
+import codecs
+import functools
+import io
 import os
 import re
 import selectors
+import shlex
 import subprocess
 import sys
+import threading
 import time
-from typing import Any, Dict, List, Set, Tuple
+from typing import IO, Any, Dict, List, Optional, Set, Tuple
 
-from .common import die, git, now_utc
+from .common import die, git, git_to_file, head_commit, local_branch_commit, now_utc
 from .render_helper import ensure_render_helper
 from .runner_helper import DEFAULT_RUNNER_COMMAND, ensure_runner_helper
 
@@ -32,61 +37,96 @@ SKIP_DIRS: Set[str] = {
     "venv",
 }
 
+_VISUAL_SUFFIXES = tuple(sorted(VISUAL_EXTENSIONS))
+
 MAX_VISUAL_BYTES = 30 * 1024 * 1024
 MAX_VISUAL_ARTIFACTS = 8
+TAIL_CHUNK_BYTES = 8192
+# One read drains a full Linux pipe buffer, so chatty commands take fewer loop turns.
+PIPE_READ_BYTES = 64 * 1024
+ECHO_FLUSH_SEC = 0.05
+
+# "- name:" bullets, one match per line in a single scan of the whole file. [^\S\n] is
+# whitespace other than newline, so a match never spans lines.
+_AGENTS_SKILL_RE = re.compile(r"^[^\S\n]*-[^\S\n]*([a-zA-Z0-9-]+)[^\S\n]*:", re.MULTILINE)
+
+
+# AGENTS.md parses keyed like state's record cache: (mtime_ns, size), skipping files
+# touched within the racy window.
+_AGENTS_RACY_WINDOW_NS = 2_000_000_000
+_AGENTS_CACHE_LOCK = threading.Lock()
+_AGENTS_CACHE: Dict[str, Tuple[Tuple[int, int], Tuple[str, ...]]] = {}
 
 
 def load_agents_skills(repo: str) -> List[str]:
     agents_path = os.path.join(repo, "AGENTS.md")
-    if not os.path.exists(agents_path):
+    try:
+        with open(agents_path, "r", encoding="utf-8", errors="replace") as f:
+            st = os.fstat(f.fileno())
+            key = (st.st_mtime_ns, st.st_size)
+            with _AGENTS_CACHE_LOCK:
+                hit = _AGENTS_CACHE.get(agents_path)
+            if hit is not None and hit[0] == key:
+                return list(hit[1])
+            text = f.read()
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
-    found: List[str] = []
-    seen = set()
-    with open(agents_path, "r", encoding="utf-8", errors="replace") as f:
-        for line in f:
-            match = re.match(r"\s*-\s*([a-zA-Z0-9-]+)\s*:", line)
-            if not match:
-                continue
-            skill = match.group(1).strip()
-            if not skill or skill in seen:
-                continue
-            seen.add(skill)
-            found.append(skill)
+    found = _parse_agents_skills(text)
+    if time.time_ns() - st.st_mtime_ns > _AGENTS_RACY_WINDOW_NS:
+        with _AGENTS_CACHE_LOCK:
+            _AGENTS_CACHE[agents_path] = (key, tuple(found))
     return found
 
 
+def _parse_agents_skills(text: str) -> List[str]:
+    # dict.fromkeys dedupes while keeping first-seen order.
+    return list(dict.fromkeys(match.group(1) for match in _AGENTS_SKILL_RE.finditer(text)))
+
+
+# Keyword groups are plain substring checks: on prompt-sized text a handful of `in`
+# scans beats a compiled alternation regex.
+SKILL_KEYWORDS: Tuple[Tuple[Tuple[str, ...], Tuple[str, ...]], ...] = (
+    (("deploy", "host", "publish"), ("cloudflare-deploy", "vercel-deploy")),
+    (("game", "web game"), ("develop-web-game", "playwright")),
+    (("figma", "design"), ("figma",)),
+    (("ci", "actions", "check"), ("gh-fix-ci",)),
+    (("pr comment", "review comment"), ("gh-address-comments",)),
+    (("pdf",), ("pdf",)),
+    (("docx", "word document"), ("doc",)),
+    (("screenshot",), ("screenshot",)),
+    (("image", "inpaint", "background"), ("imagegen",)),
+    (("speech", "tts", "voice"), ("speech",)),
+    (("sentry", "production error"), ("sentry",)),
+)
+DEFAULT_SKILLS: Tuple[str, ...] = ("playwright", "gh-fix-ci", "gh-address-comments", "skill-creator")
+
+
 def suggest_skills(intent: str, notes: str, available_skills: List[str]) -> List[str]:
+    return list(_suggest_skills_cached(intent, notes, tuple(available_skills)))
+
+
+@functools.lru_cache(maxsize=256)
+def _suggest_skills_cached(intent: str, notes: str, available_skills: Tuple[str, ...]) -> Tuple[str, ...]:
+    # Re-running the same worlds (repeat `run`, or the web backend) asks for identical suggestions.
     text = f"{intent} {notes}".lower()
-    skill_map: List[Tuple[Tuple[str, ...], Tuple[str, ...]]] = [
-        (("deploy", "host", "publish"), ("cloudflare-deploy", "vercel-deploy")),
-        (("game", "web game"), ("develop-web-game", "playwright")),
-        (("figma", "design"), ("figma",)),
-        (("ci", "actions", "check"), ("gh-fix-ci",)),
-        (("pr comment", "review comment"), ("gh-address-comments",)),
-        (("pdf",), ("pdf",)),
-        (("docx", "word document"), ("doc",)),
-        (("screenshot",), ("screenshot",)),
-        (("image", "inpaint", "background"), ("imagegen",)),
-        (("speech", "tts", "voice"), ("speech",)),
-        (("sentry", "production error"), ("sentry",)),
-    ]
-
-    chosen: List[str] = []
-    for keywords, skills in skill_map:
+    available = frozenset(available_skills)
+
+    # Insertion-ordered dict as an ordered set: O(1) dedupe, suggestion order preserved.
+    chosen: Dict[str, None] = {}
+    for keywords, skills in SKILL_KEYWORDS:
         if any(keyword in text for keyword in keywords):
             for skill in skills:
-                if skill in available_skills and skill not in chosen:
-                    chosen.append(skill)
+                if skill in available:
+                    chosen[skill] = None
 
     if not chosen:
-        defaults = ["playwright", "gh-fix-ci", "gh-address-comments", "skill-creator"]
-        for skill in defaults:
-            if skill in available_skills and skill not in chosen:
-                chosen.append(skill)
+        for skill in DEFAULT_SKILLS:
+            if skill in available:
+                chosen[skill] = None
             if len(chosen) >= 3:
                 break
-    return chosen
+    return tuple(chosen)
 
 
 def build_codex_prompt(
@@ -99,106 +139,121 @@ def build_codex_prompt(
     commit_target_count: int,
     commit_prefix: str,
 ) -> str:
-    lines: List[str] = []
-    lines.append("# Parallel World Task")
-    lines.append("")
-    lines.append(f"Intent: {branchpoint.get('intent', '')}")
-    lines.append(f"World: {world.get('name', '')}")
-    lines.append(f"Strategy: {world.get('notes', '') or '(not provided)'}")
-    lines.append(f"Branch: {world.get('branch', '')}")
-    lines.append("")
-    lines.append("## Requirements")
-    lines.append("")
-    lines.append("- Implement this world strategy in the current worktree.")
-    lines.append("- Keep changes scoped to this intent.")
-    lines.append("- After edits, run relevant tests or checks for this repo.")
-    lines.append("- Summarize what changed, tradeoffs, and residual risks.")
-    lines.append(
+    world_name = world.get("name", "")
+    buf = io.StringIO()
+    w = buf.write
+    w(
+        "# Parallel World Task\n"
+        "\n"
+        f"Intent: {branchpoint.get('intent', '')}\n"
+        f"World: {world_name}\n"
+        f"Strategy: {world.get('notes', '') or '(not provided)'}\n"
+        f"Branch: {world.get('branch', '')}\n"
+        "\n"
+        "## Requirements\n"
+        "\n"
+        "- Implement this world strategy in the current worktree.\n"
+        "- Keep changes scoped to this intent.\n"
+        "- After edits, run relevant tests or checks for this repo.\n"
+        "- Summarize what changed, tradeoffs, and residual risks.\n"
         "- If `parallel_worlds.json` exists, ensure `runner.command` and `render.command` are configured "
-        "(`python3 .parallel_worlds/runner_auto.py` and `python3 .parallel_worlds/render_auto.py`)."
+        "(`python3 .parallel_worlds/runner_auto.py` and `python3 .parallel_worlds/render_auto.py`).\n"
+        "- Do not commit `.parallel_worlds/`, `report.md`, or `play.md`.\n"
+        "\n"
+        "## Commit Plan\n"
+        "\n"
     )
-    lines.append("- Do not commit `.parallel_worlds/`, `report.md`, or `play.md`.")
-
-    lines.append("")
-    lines.append("## Commit Plan")
-    lines.append("")
     if commit_mode == "series":
-        lines.append(f"- Make at least {commit_target_count} incremental commits on this branch.")
-        lines.append("- Commit frequently as work progresses; aim for at least one commit per ~4 changed files.")
-        lines.append(f"- Commit message format: `{commit_prefix}: <short description>`.")
-        lines.append("- Commit each meaningful milestone before moving to the next.")
+        w(
+            f"- Make at least {commit_target_count} incremental commits on this branch.\n"
+            "- Commit frequently as work progresses; aim for at least one commit per ~4 changed files.\n"
+            f"- Commit message format: `{commit_prefix}: <short description>`.\n"
+            "- Commit each meaningful milestone before moving to the next.\n"
+        )
     else:
-        lines.append("- Keep changes in one focused final commit.")
-        lines.append(f"- Commit message format: `{commit_prefix}: <short description>`.")
-    lines.append("- Use explicit commit identity flags:")
-    lines.append('  `git -c user.name=\"Parallel Worlds\" -c user.email=\"parallel-worlds@local\" commit -m \"...\"`')
+        w(
+            "- Keep changes in one focused final commit.\n"
+            f"- Commit message format: `{commit_prefix}: <short description>`.\n"
+        )
+    w(
+        "- Use explicit commit identity flags:\n"
+        '  `git -c user.name=\"Parallel Worlds\" -c user.email=\"parallel-worlds@local\" commit -m \"...\"`\n'
+    )
 
     if chosen_skills:
-        lines.append("")
-        lines.append("## Skill Hints")
-        lines.append("")
-        lines.append("Use these skills if they match your implementation path:")
+        w("\n## Skill Hints\n\nUse these skills if they match your implementation path:\n")
         for skill in chosen_skills:
-            lines.append(f"- ${skill}")
+            w(f"- ${skill}\n")
 
     if automation_enabled:
-        lines.append("")
-        lines.append("## Automation")
-        lines.append("")
-        lines.append("If recurring follow-up work is useful, include one suggested automation directive.")
-        lines.append("Use this exact format in your final response:")
-        lines.append("")
-        lines.append("```text")
-        lines.append(
-            f"::automation-update{{mode=\"suggested create\" name=\"{automation_name_prefix} - {world.get('name', '')}\" prompt=\"Describe the repeat task\" rrule=\"FREQ=WEEKLY;BYDAY=MO;BYHOUR=9;BYMINUTE=0\" cwds=\"{world.get('worktree', '')}\" status=\"ACTIVE\"}}"
+        w(
+            "\n"
+            "## Automation\n"
+            "\n"
+            "If recurring follow-up work is useful, include one suggested automation directive.\n"
+            "Use this exact format in your final response:\n"
+            "\n"
+            "```text\n"
+            f"::automation-update{{mode=\"suggested create\" name=\"{automation_name_prefix} - {world_name}\" prompt=\"Describe the repeat task\" rrule=\"FREQ=WEEKLY;BYDAY=MO;BYHOUR=9;BYMINUTE=0\" cwds=\"{world.get('worktree', '')}\" status=\"ACTIVE\"}}\n"
+            "```\n"
         )
-        lines.append("```")
 
-    lines.append("")
-    lines.append("## Output")
-    lines.append("")
-    lines.append("- List exact files changed.")
-    lines.append("- Include commands executed and their outcomes.")
-    lines.append("- If blocked, state what is missing and stop.")
-    lines.append("")
-    return "\n".join(lines)
+    w(
+        "\n"
+        "## Output\n"
+        "\n"
+        "- List exact files changed.\n"
+        "- Include commands executed and their outcomes.\n"
+        "- If blocked, state what is missing and stop.\n"
+    )
+    return buf.getvalue()
+
+
+def _open_for_write(path: str, binary: bool = False) -> IO[Any]:
+    # run_*_world create the meta dir up front; only pay for makedirs when it is really missing.
+    mode, encoding = ("wb", None) if binary else ("w", "utf-8")
+    try:
+        return open(path, mode, encoding=encoding)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return open(path, mode, encoding=encoding)
 
 
 def write_codex_prompt(world_meta_dir: str, prompt_text: str) -> str:
-    os.makedirs(world_meta_dir, exist_ok=True)
     path = os.path.join(world_meta_dir, "CODEX_PROMPT.md")
-    with open(path, "w", encoding="utf-8") as f:
+    with _open_for_write(path) as f:
         f.write(prompt_text)
     return path
 
 
+# One pass over the template; other braces (shell ${VAR}, awk '{...}') are left alone,
+# which rules out str.format_map.
+_COMMAND_PLACEHOLDER_RE = re.compile(r"\{(prompt_file|world_id|world_name|worktree|intent|strategy)\}")
+
+
 def build_codex_command(command_template: str, prompt_file: str, world: Dict[str, Any], branchpoint: Dict[str, Any]) -> str:
     replacements = {
-        "{prompt_file}": prompt_file,
-        "{world_id}": str(world.get("id", "")),
-        "{world_name}": str(world.get("name", "")),
-        "{worktree}": str(world.get("worktree", "")),
-        "{intent}": str(branchpoint.get("intent", "")),
-        "{strategy}": str(world.get("notes", "")),
+        "prompt_file": prompt_file,
+        "world_id": str(world.get("id", "")),
+        "world_name": str(world.get("name", "")),
+        "worktree": str(world.get("worktree", "")),
+        "intent": str(branchpoint.get("intent", "")),
+        "strategy": str(world.get("notes", "")),
     }
-    command = command_template
-    for key, value in replacements.items():
-        command = command.replace(key, value)
+    command = _COMMAND_PLACEHOLDER_RE.sub(lambda m: replacements[m.group(1)], command_template)
     if "{prompt_file}" not in command_template:
         command = f'{command} < "{prompt_file}"'
     return command
 
 
 def save_named_log(meta_dir: str, filename: str, stdout: str, stderr: str) -> str:
-    os.makedirs(meta_dir, exist_ok=True)
     path = os.path.join(meta_dir, filename)
-    with open(path, "w", encoding="utf-8") as f:
-        if stdout:
-            f.write(stdout)
-        if stderr:
-            if stdout:
-                f.write("\n--- STDERR ---\n")
-            f.write(stderr)
+    if stdout and stderr:
+        text = f"{stdout}\n--- STDERR ---\n{stderr}"
+    else:
+        text = stdout or stderr
+    with _open_for_write(path) as f:
+        f.write(text)
     return path
 
 
@@ -206,6 +261,27 @@ def save_trace(meta_dir: str, stdout: str, stderr: str) -> str:
     return save_named_log(meta_dir, "trace.log", stdout, stderr)
 
 
+# Anything that needs sh to interpret it (pipes, redirects, expansion, globs, comments).
+_SHELL_METACHARS = frozenset("|&;<>()$`*?[]~{}#!\n")
+
+
+def _spawn(command: str, cwd: str) -> subprocess.Popen:
+    # Plain "program args..." commands are exec'd directly, saving the /bin/sh fork and
+    # letting a timeout kill reach the program itself. Builtins, env assignments and
+    # missing programs fail to exec and fall back to the shell, which reports them as before.
+    if not _SHELL_METACHARS.intersection(command):
+        try:
+            argv = shlex.split(command)
+        except ValueError:
+            argv = []
+        if argv:
+            try:
+                return subprocess.Popen(argv, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            except OSError:
+                pass
+    return subprocess.Popen(command, cwd=cwd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
 def execute_logged_command(
     command: str,
     cwd: str,
@@ -224,135 +300,190 @@ def execute_logged_command(
         payload["error"] = "command not configured"
         return payload
 
-    start = time.time()
-    stdout_chunks: List[str] = []
-    stderr_chunks: List[str] = []
+    start = time.monotonic()
+    stderr_buf = bytearray()
     timed_out = False
 
-    try:
-        process = subprocess.Popen(
-            command,
-            cwd=cwd,
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-    except OSError as exc:
-        duration = time.time() - start
-        payload["exit_code"] = -1
-        payload["duration_sec"] = round(duration, 2)
-        payload["error"] = str(exc)
-        payload["log_file"] = save_named_log(meta_dir, log_filename, "", str(exc))
-        return payload
-
-    selector = selectors.DefaultSelector()
-    if process.stdout:
-        selector.register(process.stdout, selectors.EVENT_READ, data="stdout")
-    if process.stderr:
-        selector.register(process.stderr, selectors.EVENT_READ, data="stderr")
-
-    try:
-        while True:
-            if timeout_sec > 0 and (time.time() - start) > timeout_sec:
-                timed_out = True
-                process.kill()
-                break
-
-            if not selector.get_map():
-                if process.poll() is not None:
-                    break
-                time.sleep(0.05)
-                continue
-
-            events = selector.select(timeout=0.2)
-            if not events:
-                if process.poll() is not None:
-                    # Process exited; loop again to fully drain remaining buffered output.
-                    continue
-                continue
+    # stdout goes to the log as it arrives; stderr is usually small and is appended after
+    # the separator at the end, so the log layout matches save_named_log.
+    log_path = os.path.join(meta_dir, log_filename)
+    with _open_for_write(log_path, binary=True) as log:
+        payload["log_file"] = log_path
+        try:
+            process = _spawn(command, cwd)
+        except OSError as exc:
+            duration = time.monotonic() - start
+            payload["exit_code"] = -1
+            payload["duration_sec"] = round(duration, 2)
+            payload["error"] = str(exc)
+            log.write(str(exc).encode("utf-8"))
+            return payload
+
+        # The log keeps the raw bytes. Only the console echo is decoded, incrementally, so a
+        # UTF-8 sequence split across two reads is not turned into replacement characters.
+        # Console echo is flushed at most every ECHO_FLUSH_SEC (and whenever output switches
+        # between stdout and stderr, to keep their order) instead of once per chunk.
+        pending: Optional[bool] = None
+        flushed_at = start
+
+        def flush_echo() -> None:
+            nonlocal pending, flushed_at
+            if pending is not None:
+                (sys.stderr if pending else sys.stdout).flush()
+                pending = None
+            flushed_at = time.monotonic()
+
+        def echo(to_stderr: bool, text: str) -> None:
+            # sys.stdout/sys.stderr are looked up per chunk so web job-log redirection still applies.
+            nonlocal pending
+            if not text:
+                return
+            if pending is not None and pending != to_stderr:
+                flush_echo()
+            print(text, end="", file=sys.stderr if to_stderr else sys.stdout)
+            pending = to_stderr
+            if time.monotonic() - flushed_at >= ECHO_FLUSH_SEC:
+                flush_echo()
+
+        def emit(key: selectors.SelectorKey, chunk: bytes) -> None:
+            to_stderr, sink, decoder = key.data
+            sink(chunk)
+            echo(to_stderr, decoder.decode(chunk))
+
+        def new_decoder() -> codecs.IncrementalDecoder:
+            return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        selector = selectors.DefaultSelector()
+        streams: List[Tuple[bool, Any, codecs.IncrementalDecoder]] = []
+        if process.stdout:
+            streams.append((False, log.write, new_decoder()))
+            selector.register(process.stdout, selectors.EVENT_READ, data=streams[-1])
+        if process.stderr:
+            streams.append((True, stderr_buf.extend, new_decoder()))
+            selector.register(process.stderr, selectors.EVENT_READ, data=streams[-1])
 
-            for key, _ in events:
-                stream = str(key.data)
-                chunk = os.read(key.fileobj.fileno(), 4096)
-                if not chunk:
-                    selector.unregister(key.fileobj)
-                    key.fileobj.close()
-                    continue
-                text = chunk.decode("utf-8", errors="replace")
-                if stream == "stdout":
-                    stdout_chunks.append(text)
-                    print(text, end="", flush=True)
-                else:
-                    stderr_chunks.append(text)
-                    print(text, end="", file=sys.stderr, flush=True)
-
-        # Drain any remaining output after process exit/kill.
-        for key in list(selector.get_map().values()):
-            stream = str(key.data)
-            while True:
-                chunk = os.read(key.fileobj.fileno(), 4096)
-                if not chunk:
-                    break
-                text = chunk.decode("utf-8", errors="replace")
-                if stream == "stdout":
-                    stdout_chunks.append(text)
-                    print(text, end="", flush=True)
-                else:
-                    stderr_chunks.append(text)
-                    print(text, end="", file=sys.stderr, flush=True)
-            selector.unregister(key.fileobj)
-            key.fileobj.close()
-    finally:
-        selector.close()
-
-    duration = time.time() - start
+        try:
+            # Block on pipe readiness up to the deadline; EOF on both pipes wakes the loop
+            # when the child exits, so there is no fixed-interval polling.
+            while selector.get_map():
+                remaining = None
+                if timeout_sec > 0:
+                    remaining = timeout_sec - (time.monotonic() - start)
+                    if remaining <= 0:
+                        timed_out = True
+                        process.kill()
+                        break
+
+                wait = remaining
+                if pending is not None:
+                    wait = ECHO_FLUSH_SEC if wait is None else min(wait, ECHO_FLUSH_SEC)
+                events = selector.select(timeout=wait)
+                if not events:
+                    flush_echo()
+                for key, _ in events:
+                    chunk = os.read(key.fileobj.fileno(), PIPE_READ_BYTES)
+                    if not chunk:
+                        selector.unregister(key.fileobj)
+                        key.fileobj.close()
+                        continue
+                    emit(key, chunk)
+
+            flush_echo()
+            if not timed_out:
+                try:
+                    process.wait(timeout=(timeout_sec - (time.monotonic() - start)) if timeout_sec > 0 else None)
+                except subprocess.TimeoutExpired:
+                    timed_out = True
+                    process.kill()
+
+            # Drain any remaining output after process exit/kill.
+            for key in list(selector.get_map().values()):
+                while True:
+                    chunk = os.read(key.fileobj.fileno(), PIPE_READ_BYTES)
+                    if not chunk:
+                        break
+                    emit(key, chunk)
+                selector.unregister(key.fileobj)
+                key.fileobj.close()
+        finally:
+            selector.close()
+            for to_stderr, _, decoder in streams:
+                echo(to_stderr, decoder.decode(b"", final=True))
+            flush_echo()
+
+        if stderr_buf:
+            if log.tell():
+                stderr_buf[:0] = b"\n--- STDERR ---\n"
+            log.write(stderr_buf)
+
+    duration = time.monotonic() - start
     payload["duration_sec"] = round(duration, 2)
     payload["exit_code"] = -1 if timed_out else process.wait()
     if timed_out:
         payload["error"] = f"timeout after {timeout_sec}s"
-    payload["log_file"] = save_named_log(
-        meta_dir,
-        log_filename,
-        "".join(stdout_chunks),
-        "".join(stderr_chunks),
-    )
 
     return payload
 
 
-def parse_numstat(output: str) -> Dict[str, int]:
+def _numstat_count(raw: bytes) -> Optional[int]:
+    # "-" marks a binary file; anything else non-numeric makes the row unusable.
+    if raw == b"-":
+        return 0
+    return int(raw) if raw.isdigit() else None
+
+
+def parse_numstat(output: bytes) -> Tuple[Dict[str, int], List[str]]:
+    # Expects raw `git diff --numstat -z`: "added\tdeleted\tpath\0", or for renames
+    # "added\tdeleted\t\0old\0new\0". Returns the totals and the changed paths.
     added = 0
     deleted = 0
-    files = 0
-    for line in output.splitlines():
-        parts = line.split("\t")
-        if len(parts) < 3:
+    names: List[str] = []
+    tokens = iter(output.split(b"\0"))
+    for token in tokens:
+        a_raw, _, rest = token.partition(b"\t")
+        d_raw, sep, path = rest.partition(b"\t")
+        if not sep:
             continue
-        a_raw, d_raw = parts[0], parts[1]
-        try:
-            a = int(a_raw) if a_raw != "-" else 0
-            d = int(d_raw) if d_raw != "-" else 0
-        except ValueError:
+        if not path:
+            next(tokens, None)
+            path = next(tokens, b"")
+        a = _numstat_count(a_raw)
+        d = _numstat_count(d_raw)
+        if a is None or d is None:
             continue
         added += a
         deleted += d
-        files += 1
-    return {"files": files, "added": added, "deleted": deleted}
+        if path:
+            names.append(path.decode("utf-8", errors="replace"))
+    return {"files": len(names), "added": added, "deleted": deleted}, names
 
 
 def collect_diff(meta_dir: str, base_branch: str, worktree_path: str) -> Dict[str, Any]:
-    os.makedirs(meta_dir, exist_ok=True)
-
+    diff_range = f"{base_branch}...HEAD"
     patch_path = os.path.join(meta_dir, "diff.patch")
-    patch = git(["-C", worktree_path, "diff", f"{base_branch}...HEAD"], check=False)
-    with open(patch_path, "w", encoding="utf-8") as f:
-        f.write(patch.stdout or "")
-
-    numstat = git(["-C", worktree_path, "diff", "--numstat", f"{base_branch}...HEAD"], check=False)
-    stats = parse_numstat(numstat.stdout or "")
-
-    files_changed = git(["-C", worktree_path, "diff", "--name-only", f"{base_branch}...HEAD"], check=False)
-    names = [x.strip() for x in (files_changed.stdout or "").splitlines() if x.strip()]
+    if not os.path.isdir(meta_dir):
+        os.makedirs(meta_dir, exist_ok=True)
+    # A world still sitting on the base tip (nothing committed) has an empty base...HEAD
+    # diff by definition; skip both git processes.
+    head = head_commit(worktree_path)
+    if head is not None and head == local_branch_commit(worktree_path, base_branch):
+        with _open_for_write(patch_path, binary=True):
+            pass
+        return {
+            "diff_patch": patch_path,
+            "diff_stats": {"files": 0, "added": 0, "deleted": 0},
+            "changed_files": [],
+        }
+    # numstat already carries the path, so one pass covers both stats and changed files.
+    # It runs alongside the patch write; its output is small and read once the patch is done.
+    numstat = subprocess.Popen(
+        ["git", "-C", worktree_path, "diff", "--numstat", "-z", diff_range],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    git_to_file(["-C", worktree_path, "diff", diff_range], patch_path)
+    numstat_out, _ = numstat.communicate()
+    stats, names = parse_numstat(numstat_out or b"")
 
     return {
         "diff_patch": patch_path,
@@ -420,8 +551,7 @@ def run_codex_world(
     timeout_sec = int(codex_cfg.get("timeout_sec", 900))
     command = build_codex_command(template, prompt_file, world, branchpoint)
     payload["codex_command"] = command
-    before_head = git(["rev-parse", "HEAD"], cwd=world["worktree"], check=False).stdout.strip()
-
+    before_head = head_commit(world["worktree"]) or ""
     cmd_result = execute_logged_command(
         command=command,
         cwd=world["worktree"],
@@ -429,11 +559,11 @@ def run_codex_world(
         meta_dir=world_meta_dir,
         log_filename="codex.log",
     )
+    after_head = head_commit(world["worktree"]) or ""
     payload["exit_code"] = cmd_result["exit_code"]
     payload["duration_sec"] = cmd_result["duration_sec"]
     payload["log_file"] = cmd_result["log_file"]
     payload["error"] = cmd_result["error"]
-    after_head = git(["rev-parse", "HEAD"], cwd=world["worktree"], check=False).stdout.strip()
     payload["before_head"] = before_head or None
     payload["after_head"] = after_head or None
     payload["commit_count"] = 0
@@ -495,35 +625,71 @@ def run_world(world: Dict[str, Any], branchpoint: Dict[str, Any], runner_cmd: st
 
 
 def discover_visual_artifacts(worktree_path: str) -> List[str]:
-    found: List[str] = []
-    for root, dirs, files in os.walk(worktree_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        for name in files:
-            ext = os.path.splitext(name)[1].lower()
-            if ext not in VISUAL_EXTENSIONS:
+    return [path for path, _ in _scan_visual_artifacts(worktree_path)]
+
+
+def _scan_visual_artifacts(worktree_path: str) -> List[Tuple[str, float]]:
+    # Same traversal as os.walk (top-down, symlinked dirs listed but not entered), but on
+    # scandir entries: d_type answers is_dir/is_symlink without a stat, and only symlinks
+    # need realpath since everything else sits under the already-resolved root.
+    found: List[Tuple[str, float]] = []
+    stack = [os.path.realpath(worktree_path)]
+    while stack:
+        root = stack.pop()
+        try:
+            with os.scandir(root) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs: List[str] = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if entry.name not in SKIP_DIRS and not entry.is_symlink():
+                    subdirs.append(entry.path)
+                continue
+            name = entry.name.lower()
+            # Same answer as splitext: a leading-dots-only stem (".png") has no extension.
+            if not name.endswith(_VISUAL_SUFFIXES) or not name[: name.rfind(".")].strip("."):
                 continue
-            path = os.path.realpath(os.path.join(root, name))
             try:
-                size = os.path.getsize(path)
+                if entry.is_symlink():
+                    path = os.path.realpath(entry.path)
+                    st = os.stat(path)
+                else:
+                    path = entry.path
+                    st = entry.stat()
             except OSError:
                 continue
-            if size > MAX_VISUAL_BYTES:
+            if st.st_size > MAX_VISUAL_BYTES:
                 continue
-            found.append(path)
+            found.append((path, st.st_mtime))
+        stack.extend(reversed(subdirs))
     return found
 
 
-def select_visual_artifacts(before: Set[str], after: List[str]) -> List[str]:
+def _mtime_or_zero(path: str) -> float:
+    # One stat per path; a missing file sorts last instead of costing an extra exists() call.
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0.0
+
+
+def select_visual_artifacts(before: Set[str], after: List[str], mtimes: Optional[Dict[str, float]] = None) -> List[str]:
     if not after:
         return []
 
     new_paths = [path for path in after if path not in before]
     candidates = new_paths if new_paths else after
-    candidates = sorted(
-        candidates,
-        key=lambda path: os.path.getmtime(path) if os.path.exists(path) else 0.0,
-        reverse=True,
-    )
+    # mtimes from the scan that produced `after` avoid a second stat per candidate.
+    if mtimes is None:
+        candidates = sorted(candidates, key=_mtime_or_zero, reverse=True)
+    else:
+        candidates = sorted(candidates, key=lambda path: mtimes.get(path, 0.0), reverse=True)
     unique: List[str] = []
     seen: Set[str] = set()
     for path in candidates:
@@ -575,8 +741,12 @@ def run_render_world(world: Dict[str, Any], branchpoint: Dict[str, Any], render_
     payload["duration_sec"] = cmd_result["duration_sec"]
     payload["render_log"] = cmd_result["log_file"]
     payload["error"] = cmd_result["error"]
-    after_artifacts = discover_visual_artifacts(world["worktree"])
-    payload["visual_artifacts"] = select_visual_artifacts(before_artifacts, after_artifacts)
+    after_scan = _scan_visual_artifacts(world["worktree"])
+    payload["visual_artifacts"] = select_visual_artifacts(
+        before_artifacts,
+        [path for path, _ in after_scan],
+        dict(after_scan),
+    )
 
     payload["finished_at"] = now_utc()
     return payload
@@ -585,6 +755,14 @@ def run_render_world(world: Dict[str, Any], branchpoint: Dict[str, Any], render_
 def tail_file(path: str, line_count: int) -> List[str]:
     if line_count <= 0 or not os.path.exists(path):
         return []
-    with open(path, "r", encoding="utf-8", errors="replace") as f:
-        lines = f.read().splitlines()
-    return lines[-line_count:]
+    # Read backwards from EOF until more than line_count newlines are buffered, so the
+    # (possibly partial) first line of the buffer is never part of the result.
+    with open(path, "rb") as f:
+        pos = os.fstat(f.fileno()).st_size
+        data = b""
+        while pos > 0 and data.count(b"\n") <= line_count:
+            step = min(TAIL_CHUNK_BYTES, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    return data.decode("utf-8", errors="replace").splitlines()[-line_count:]
@@ -0,0 +1,98 @@
+import atexit
+import os
+import subprocess
+import threading
+from typing import Dict, Optional
+
+
+class GitBatch:
+    # One long-lived `git cat-file --batch-check` per worktree; each lookup is a line
+    # written to stdin instead of a fresh `git rev-parse` process.
+
+    def __init__(self, cwd: str):
+        self.cwd = cwd
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def _process(self) -> Optional[subprocess.Popen]:
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+        try:
+            self._proc = subprocess.Popen(
+                ["git", "cat-file", "--batch-check"],
+                cwd=self.cwd,
+                text=True,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            self._proc = None
+        return self._proc
+
+    def rev_parse(self, ref: str) -> Optional[str]:
+        ref = ref.strip()
+        # --batch-check echoes the ref back, so whitespace would shift the reply fields.
+        if not ref or any(ch.isspace() for ch in ref):
+            return None
+        with self._lock:
+            proc = self._process()
+            if proc is None or proc.stdin is None or proc.stdout is None:
+                return None
+            try:
+                proc.stdin.write(ref + "\n")
+                proc.stdin.flush()
+                line = proc.stdout.readline()
+            except (OSError, ValueError):
+                self._close()
+                return None
+        # "<oid> <type> <size>" on success, "<ref> missing" / "<ref> ambiguous" otherwise.
+        parts = line.split()
+        if len(parts) < 2 or parts[-1] in ("missing", "ambiguous"):
+            return None
+        return parts[0]
+
+    def exists(self, ref: str) -> bool:
+        return self.rev_parse(ref) is not None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        proc = self._proc
+        self._proc = None
+        if proc is None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+        finally:
+            if proc.stdout:
+                proc.stdout.close()
+
+
+_SHARED_LOCK = threading.Lock()
+_SHARED: Dict[str, GitBatch] = {}
+
+
+def repo_batch(repo: str) -> GitBatch:
+    # Ref lookups from common.* reuse one batch process per repository for the whole run.
+    key = os.path.realpath(repo)
+    with _SHARED_LOCK:
+        batch = _SHARED.get(key)
+        if batch is None:
+            batch = _SHARED[key] = GitBatch(key)
+        return batch
+
+
+@atexit.register
+def _close_shared() -> None:
+    with _SHARED_LOCK:
+        batches = list(_SHARED.values())
+        _SHARED.clear()
+    for batch in batches:
+        batch.close()
@@ -1,8 +1,52 @@
 import json
 import os
-from typing import Any, Dict, List, Optional
-
-from .common import die, git_common_dir, read_json, write_json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .common import clone_json, die, git_common_dir, read_json, write_json, write_text_atomic
+
+_PARALLEL_IO_MIN = 16
+_CACHE_MAX_ENTRIES = 1024
+# Files modified this recently are never cached: a rewrite within the same mtime tick
+# could keep the same (mtime, size) key while changing content (git's "racy clean" rule).
+_CACHE_RACY_WINDOW_NS = 2_000_000_000
+_CACHE_LOCK = threading.Lock()
+_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+# "compact" stores metadata as single-line JSON: it goes through the C encoder (indent
+# forces the pure-Python one) and loads the same way, so both layouts can coexist.
+_METADATA_FORMAT = os.environ.get("PW_METADATA_FORMAT", "json").strip().lower()
+
+
+def _read_cached(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+    with _CACHE_LOCK:
+        hit = _CACHE.get(path)
+        if hit is not None and hit[0] == key:
+            _CACHE.move_to_end(path)
+            return clone_json(hit[1])
+
+    payload = read_json(path)
+    if time.time_ns() - st.st_mtime_ns > _CACHE_RACY_WINDOW_NS:
+        with _CACHE_LOCK:
+            _CACHE[path] = (key, clone_json(payload))
+            _CACHE.move_to_end(path)
+            while len(_CACHE) > _CACHE_MAX_ENTRIES:
+                _CACHE.popitem(last=False)
+    return payload
+
+
+def _write_record(path: str, payload: Dict[str, Any]) -> None:
+    if _METADATA_FORMAT != "compact":
+        write_json(path, payload)
+        return
+    write_text_atomic(path, json.dumps(payload, separators=(",", ":")) + "\n")
 
 
 def metadata_root(repo: str) -> str:
@@ -34,17 +78,24 @@ def latest_branchpoint_path(repo: str) -> str:
     return os.path.join(metadata_root(repo), "latest_branchpoint.txt")
 
 
+_ENSURED_ROOTS: Set[str] = set()
+
+
 def ensure_metadata_dirs(repo: str) -> None:
+    # Once per process per metadata root; record writes recreate their own parent dirs anyway.
+    root = metadata_root(repo)
+    if root in _ENSURED_ROOTS:
+        return
     os.makedirs(branchpoints_dir(repo), exist_ok=True)
     os.makedirs(worlds_meta_dir(repo), exist_ok=True)
     os.makedirs(runs_dir(repo), exist_ok=True)
     os.makedirs(codex_runs_dir(repo), exist_ok=True)
     os.makedirs(renders_dir(repo), exist_ok=True)
+    _ENSURED_ROOTS.add(root)
 
 
 def set_latest_branchpoint(repo: str, branchpoint_id: str) -> None:
-    with open(latest_branchpoint_path(repo), "w", encoding="utf-8") as f:
-        f.write(branchpoint_id + "\n")
+    write_text_atomic(latest_branchpoint_path(repo), branchpoint_id + "\n")
 
 
 def get_latest_branchpoint(repo: str) -> Optional[str]:
@@ -76,76 +127,120 @@ def render_file(repo: str, branchpoint_id: str, world_id: str) -> str:
     return os.path.join(renders_dir(repo), branchpoint_id, f"{world_id}.json")
 
 
+def _read_listed(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        return _read_cached(path)
+    except json.JSONDecodeError:
+        return None
+
+
 def list_branchpoints(repo: str) -> List[Dict[str, Any]]:
     out: List[Dict[str, Any]] = []
     root = branchpoints_dir(repo)
     if not os.path.exists(root):
         return out
-    for name in sorted(os.listdir(root)):
-        if not name.endswith(".json"):
-            continue
-        path = os.path.join(root, name)
-        try:
-            out.append(read_json(path))
-        except json.JSONDecodeError:
-            continue
+    paths = [os.path.join(root, name) for name in sorted(os.listdir(root)) if name.endswith(".json")]
+    if len(paths) < _PARALLEL_IO_MIN:
+        payloads = [_read_listed(path) for path in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            payloads = list(executor.map(_read_listed, paths))
+    out.extend(payload for payload in payloads if payload is not None)
     out.sort(key=lambda x: x.get("created_at", ""), reverse=True)
     return out
 
 
 def load_branchpoint(repo: str, branchpoint_id: str) -> Dict[str, Any]:
-    path = branchpoint_file(repo, branchpoint_id)
-    if not os.path.exists(path):
+    payload = _read_cached(branchpoint_file(repo, branchpoint_id))
+    if payload is None:
         die(f"branchpoint not found: {branchpoint_id}")
-    return read_json(path)
+    return payload
 
 
 def load_world(repo: str, world_id: str) -> Dict[str, Any]:
-    path = world_meta_file(repo, world_id)
-    if not os.path.exists(path):
+    payload = _read_cached(world_meta_file(repo, world_id))
+    if payload is None:
         die(f"world metadata missing: {world_id}")
-    return read_json(path)
+    return payload
 
 
 def load_run(repo: str, branchpoint_id: str, world_id: str) -> Optional[Dict[str, Any]]:
-    path = run_file(repo, branchpoint_id, world_id)
-    if not os.path.exists(path):
-        return None
-    return read_json(path)
+    return _read_cached(run_file(repo, branchpoint_id, world_id))
 
 
 def load_codex_run(repo: str, branchpoint_id: str, world_id: str) -> Optional[Dict[str, Any]]:
-    path = codex_run_file(repo, branchpoint_id, world_id)
-    if not os.path.exists(path):
-        return None
-    return read_json(path)
+    return _read_cached(codex_run_file(repo, branchpoint_id, world_id))
 
 
 def load_render(repo: str, branchpoint_id: str, world_id: str) -> Optional[Dict[str, Any]]:
-    path = render_file(repo, branchpoint_id, world_id)
-    if not os.path.exists(path):
-        return None
-    return read_json(path)
+    return _read_cached(render_file(repo, branchpoint_id, world_id))
+
+
+def _load_records(directory: str, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    # One directory scan instead of a stat per id; large batches are read in parallel.
+    try:
+        with os.scandir(directory) as it:
+            present = {entry.name for entry in it if entry.is_file()}
+    except FileNotFoundError:
+        return {}
+    wanted = [rid for rid in dict.fromkeys(ids) if f"{rid}.json" in present]
+    paths = [os.path.join(directory, f"{rid}.json") for rid in wanted]
+    if len(paths) < _PARALLEL_IO_MIN:
+        payloads = [_read_cached(path) for path in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            payloads = list(executor.map(_read_cached, paths))
+    return {rid: payload for rid, payload in zip(wanted, payloads) if payload is not None}
+
+
+def load_worlds(repo: str, world_ids: List[str]) -> List[Dict[str, Any]]:
+    found = _load_records(worlds_meta_dir(repo), world_ids)
+    for world_id in world_ids:
+        if world_id not in found:
+            die(f"world metadata missing: {world_id}")
+    return [found[world_id] for world_id in world_ids]
+
+
+def load_runs(repo: str, branchpoint_id: str, world_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    return _load_records(os.path.join(runs_dir(repo), branchpoint_id), world_ids)
+
+
+def load_codex_runs(repo: str, branchpoint_id: str, world_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    return _load_records(os.path.join(codex_runs_dir(repo), branchpoint_id), world_ids)
+
+
+def load_renders(repo: str, branchpoint_id: str, world_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    return _load_records(os.path.join(renders_dir(repo), branchpoint_id), world_ids)
 
 
 def save_branchpoint(repo: str, payload: Dict[str, Any]) -> None:
-    write_json(branchpoint_file(repo, payload["id"]), payload)
+    _write_record(branchpoint_file(repo, payload["id"]), payload)
 
 
 def save_world(repo: str, payload: Dict[str, Any]) -> None:
-    write_json(world_meta_file(repo, payload["id"]), payload)
+    _write_record(world_meta_file(repo, payload["id"]), payload)
+
+
+def save_worlds(repo: str, worlds: List[Dict[str, Any]]) -> None:
+    paths = [world_meta_file(repo, world["id"]) for world in worlds]
+    if len(paths) < _PARALLEL_IO_MIN:
+        for path, world in zip(paths, worlds):
+            _write_record(path, world)
+        return
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_write_record, paths, worlds))
 
 
 def save_run(repo: str, branchpoint_id: str, world_id: str, payload: Dict[str, Any]) -> None:
-    write_json(run_file(repo, branchpoint_id, world_id), payload)
+    _write_record(run_file(repo, branchpoint_id, world_id), payload)
 
 
 def save_codex_run(repo: str, branchpoint_id: str, world_id: str, payload: Dict[str, Any]) -> None:
-    write_json(codex_run_file(repo, branchpoint_id, world_id), payload)
+    _write_record(codex_run_file(repo, branchpoint_id, world_id), payload)
 
 
 def save_render(repo: str, branchpoint_id: str, world_id: str, payload: Dict[str, Any]) -> None:
-    write_json(render_file(repo, branchpoint_id, world_id), payload)
+    _write_record(render_file(repo, branchpoint_id, world_id), payload)
 
 
 def resolve_branchpoint_id(repo: str, explicit_id: Optional[str]) -> str:
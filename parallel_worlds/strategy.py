@@ -12,7 +12,10 @@ def strategy_list_is_placeholder(strategies: List[Dict[str, Any]]) -> bool:
     for item in strategies:
         if not isinstance(item, dict):
             return False
-        names.add(str(item.get("name", "")).strip())
+        name = str(item.get("name", "")).strip()
+        if name not in PLACEHOLDER_STRATEGY_NAMES:
+            return False
+        names.add(name)
     return names == PLACEHOLDER_STRATEGY_NAMES
 
 
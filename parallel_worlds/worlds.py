@@ -2,7 +2,7 @@ import os
 import shutil
 from typing import Any, Dict, List, Optional
 
-from .common import branch_exists, commit_exists, current_branch, die, git, is_subpath
+from .common import branch_exists, commit_exists, current_branch, die, git, git_ok, is_subpath
 
 
 def ensure_base_branch(base_branch: str, repo: str) -> None:
@@ -39,14 +39,13 @@ def resolve_start_ref(repo: str, base_branch: str, from_ref: Optional[str]) -> s
 
 
 def _remove_worktree_path(repo: str, worktree_path: str) -> None:
-    git(["worktree", "remove", "--force", worktree_path], cwd=repo, check=False)
+    git_ok(["worktree", "remove", "--force", worktree_path], cwd=repo)
     if os.path.exists(worktree_path):
         shutil.rmtree(worktree_path, ignore_errors=True)
 
 
 def _ensure_existing_worktree_matches(repo: str, worktree_path: str, branch: str, start_ref: str) -> bool:
-    probe = git(["-C", worktree_path, "rev-parse", "--is-inside-work-tree"], check=False)
-    if probe.returncode != 0:
+    if not git_ok(["-C", worktree_path, "rev-parse", "--is-inside-work-tree"]):
         _remove_worktree_path(repo, worktree_path)
         return False
 
@@ -57,10 +56,10 @@ def _ensure_existing_worktree_matches(repo: str, worktree_path: str, branch: str
     status = git(["-C", worktree_path, "status", "--porcelain"], check=False)
     if status.returncode == 0 and not (status.stdout or "").strip():
         if branch_exists(branch, repo):
-            checkout = git(["-C", worktree_path, "checkout", branch], check=False)
+            checked_out = git_ok(["-C", worktree_path, "checkout", branch])
         else:
-            checkout = git(["-C", worktree_path, "checkout", "-b", branch, start_ref], check=False)
-        if checkout.returncode == 0:
+            checked_out = git_ok(["-C", worktree_path, "checkout", "-b", branch, start_ref])
+        if checked_out:
             return True
 
     _remove_worktree_path(repo, worktree_path)
@@ -73,13 +72,18 @@ def _add_new_worktree(repo: str, branch: str, start_ref: str, worktree_path: str
             return ["worktree", "add", worktree_path, branch]
         return ["worktree", "add", "-b", branch, worktree_path, start_ref]
 
-    first_args = _args()
-    first = git(first_args, cwd=repo, check=False)
+    # Kickoff branches are almost always new: try creating one directly and only spend a
+    # show-ref exec probing for an existing branch when that fails.
+    first = git(["worktree", "add", "-b", branch, worktree_path, start_ref], cwd=repo, check=False)
     if first.returncode == 0:
         return
+    if branch_exists(branch, repo):
+        first = git(["worktree", "add", worktree_path, branch], cwd=repo, check=False)
+        if first.returncode == 0:
+            return
 
     # Recover from stale worktree metadata and retry once.
-    git(["worktree", "prune"], cwd=repo, check=False)
+    git_ok(["worktree", "prune"], cwd=repo)
     second_args = _args()
     second = git(second_args, cwd=repo, check=False)
     if second.returncode != 0:
@@ -17,14 +17,14 @@ import threading
 import time
 import traceback
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from contextlib import contextmanager, redirect_stderr, redirect_stdout
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import parse_qs, urlencode, urlparse
 
 import pw
-from parallel_worlds.common import branch_exists, git
+from parallel_worlds.common import branch_exists, git, git_ok
 
 
 _ACTION_LOCK = threading.RLock()
@@ -35,10 +35,14 @@ _MAX_ACTION_LOG_CHARS = 250_000
 _LAUNCH_LOCK = threading.RLock()
 _WORLD_LAUNCHES: Dict[str, Dict[str, Any]] = {}
 _LAUNCH_HOST = "127.0.0.1"
+_DIGITS_RE = re.compile(r"\d+")
+_JSON_OBJECT_RE = re.compile(r"\{[\s\S]*?\}")
+_COUNT_FIELD_RE = re.compile(r'"count"\s*:\s*(\d+)')
+_PROJECT_DIR_UNSAFE_RE = re.compile(r"[^a-zA-Z0-9._-]+")
 
 
 def _now_utc() -> str:
-    return datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def _create_action_job(action: str) -> str:
@@ -136,8 +140,8 @@ def _find_free_port(host: str = _LAUNCH_HOST) -> int:
 
 
 def _wait_for_port(host: str, port: int, timeout_sec: float = 18.0, proc: Any = None) -> bool:
-    deadline = time.time() + float(timeout_sec)
-    while time.time() < deadline:
+    deadline = time.monotonic() + float(timeout_sec)
+    while time.monotonic() < deadline:
         if _is_port_open(host, port):
             return True
         if proc is not None and not _is_process_alive(proc):
@@ -408,7 +412,7 @@ def _extract_model_world_count(output: str) -> Tuple[Optional[int], Optional[str
     if not text:
         return None, None
 
-    if re.fullmatch(r"\d+", text):
+    if _DIGITS_RE.fullmatch(text):
         return int(text), None
 
     candidates: List[Dict[str, Any]] = []
@@ -419,7 +423,7 @@ def _extract_model_world_count(output: str) -> Tuple[Optional[int], Optional[str
     except json.JSONDecodeError:
         pass
 
-    for match in re.finditer(r"\{[\s\S]*?\}", text):
+    for match in _JSON_OBJECT_RE.finditer(text):
         blob = match.group(0)
         try:
             parsed = json.loads(blob)
@@ -437,7 +441,7 @@ def _extract_model_world_count(output: str) -> Tuple[Optional[int], Optional[str
         reason = str(item.get("reason", "")).strip() or None
         return count, reason
 
-    match = re.search(r'"count"\s*:\s*(\d+)', text)
+    match = _COUNT_FIELD_RE.search(text)
     if match:
         return int(match.group(1)), None
 
@@ -618,7 +622,7 @@ def _resolve_git_root(path: str) -> Optional[str]:
 
 
 def _slugify_project_dir(name: str) -> str:
-    slug = re.sub(r"[^a-zA-Z0-9._-]+", "-", (name or "").strip().lower()).strip("._-")
+    slug = _PROJECT_DIR_UNSAFE_RE.sub("-", (name or "").strip().lower()).strip("._-")
     return slug or "new-project"
 
 
@@ -738,23 +742,19 @@ def _live_branch_state(repo: str, world: Dict[str, Any], branchpoint: Dict[str,
     branch_for_scope = branch
     source_for_scope = source_ref
     if worktree and os.path.isdir(worktree):
-        inside = git(["-C", worktree, "rev-parse", "--is-inside-work-tree"], check=False)
-        if inside.returncode == 0:
+        if git_ok(["-C", worktree, "rev-parse", "--is-inside-work-tree"]):
             git_scope = worktree
             local_branch = git(["-C", worktree, "branch", "--show-current"], check=False).stdout.strip()
             if local_branch:
                 branch_for_scope = local_branch
 
             if source_ref:
-                source_probe = git(["-C", worktree, "rev-parse", "--verify", "--quiet", source_ref], check=False)
-                if source_probe.returncode == 0:
+                if git_ok(["-C", worktree, "rev-parse", "--verify", "--quiet", source_ref]):
                     source_for_scope = source_ref
+                elif git_ok(["-C", worktree, "rev-parse", "--verify", "--quiet", f"origin/{source_ref}"]):
+                    source_for_scope = f"origin/{source_ref}"
                 else:
-                    origin_probe = git(["-C", worktree, "rev-parse", "--verify", "--quiet", f"origin/{source_ref}"], check=False)
-                    if origin_probe.returncode == 0:
-                        source_for_scope = f"origin/{source_ref}"
-                    else:
-                        source_for_scope = ""
+                    source_for_scope = ""
 
     if git_scope == worktree:
         exists = bool(branch_for_scope)
@@ -959,8 +959,7 @@ def _dashboard_branchpoint_worlds(repo: str, branchpoints: List[Dict[str, Any]])
 def _is_merged_into(repo: str, source_branch: str, target_branch: str) -> bool:
     if not source_branch or not target_branch:
         return False
-    result = git(["merge-base", "--is-ancestor", source_branch, target_branch], cwd=repo, check=False)
-    return result.returncode == 0
+    return git_ok(["merge-base", "--is-ancestor", source_branch, target_branch], cwd=repo)
 
 
 def _dashboard_branch_summary(repo: str, branchpoints: List[Dict[str, Any]], selected_branchpoint_id: Optional[str]) -> Dict[str, int]: